@@ -3,14 +3,22 @@
 Создание и конфигурирование основного приложения.
 """
 
-from flask import Flask, g, request, session
+from pathlib import Path
+
+from flask import Flask, current_app, g, request, session, url_for
 
 from app.config.settings import Config
 from app.database import init_db
+from app.database.snapshot import published_snapshot
+from app.database.version_stamp import content_version_stamp
 from app.i18n import DEFAULT_LANGUAGE, LANGUAGE_LABELS, LocaleDetector, SUPPORTED_LANGUAGES
 from app.i18n.manager import translation_manager
+from app.utils.image_resize import resized_images
 from app.utils.logger import setup_logger
 
+# Статика и уменьшенные изображения: без локали, сессии и проверки версии контента
+ASSET_ENDPOINTS = ("static", "images.resized")
+
 
 def create_app(config_class=Config) -> Flask:
     """
@@ -33,22 +41,43 @@ def create_app(config_class=Config) -> Flask:
     init_db(app)
     logger.info("База данных SQLite инициализирована")
 
+    # Дисковый кеш уменьшенных по запросу изображений, общий для воркеров
+    resized_images.init_app(
+        Path(app.config["BASE_DIR"]) / "data" / "image_cache",
+        app.config.get("IMAGE_CACHE_MAX_MB", 256) * 1024 * 1024,
+        app.config.get("IMAGE_WEBP_QUALITY", 80),
+    )
+
     # Регистрация blueprints
-    from app.routes import admin_bp, backgrounds_bp, main_bp
+    from app.routes import admin_bp, backgrounds_bp, images_bp, main_bp
 
     app.register_blueprint(main_bp)
     app.register_blueprint(admin_bp)
     app.register_blueprint(backgrounds_bp)
+    app.register_blueprint(images_bp)
 
     # Инициализация определения локали
     locale_detector = LocaleDetector()
 
+    @app.before_request
+    def _check_content_version() -> None:
+        # Сбрасываем кеши, если контент изменили или опубликовали в другом воркере
+        if request.endpoint not in ASSET_ENDPOINTS:
+            content_version_stamp.check()
+            published_snapshot.check()
+
     @app.before_request
     def _set_locale() -> None:
-        locale = locale_detector.detect(request, session.get("locale"))
-        g.locale = locale
-        session["locale"] = locale
         g.translation_manager = translation_manager
+        # Язык из префикса URL (/ru/, /lv/, /en/) уже установлен, сессию не трогаем
+        if g.get("locale_from_path"):
+            return
+        # Статика не зависит от языка: не читаем сессию, чтобы не добавлять Vary: Cookie
+        if request.endpoint in ASSET_ENDPOINTS:
+            g.locale = DEFAULT_LANGUAGE
+            return
+        # Сессия только читается; записывает её лишь main.set_language
+        g.locale = locale_detector.detect(request, session.get("locale"))
 
     @app.context_processor
     def _inject_i18n():
@@ -56,17 +85,60 @@ def create_app(config_class=Config) -> Flask:
             "current_locale": getattr(g, "locale", DEFAULT_LANGUAGE),
             "available_locales": SUPPORTED_LANGUAGES,
             "locale_labels": LANGUAGE_LABELS,
+            "locale_alternates": _locale_alternates(),
+            "site_url": app.config.get("SITE_URL", "").rstrip("/"),
         }
     
     # Регистрируем хелперы для работы с контентом
-    from app.helpers import inject_content_helper
+    from app.helpers import inject_content_helper, inject_image_helper
     app.context_processor(inject_content_helper)
+    app.context_processor(inject_image_helper)
+
+    # CLI команды и статический экспорт страниц
+    from app.cli import register_cli
+    from app.utils.static_export import schedule_export
+
+    register_cli(app)
+
+    @app.after_request
+    def _refresh_static_export(response):
+        # После сохранений в админке инкрементально обновляем статический экспорт
+        if (
+            app.config.get("STATIC_EXPORT_ON_SAVE")
+            and request.method == "POST"
+            and request.blueprint in ("admin", "backgrounds")
+            and response.status_code < 400
+        ):
+            schedule_export(app)
+        return response
 
     logger.info("Flask приложение успешно инициализировано")
 
     return app
 
 
+def _locale_alternates() -> dict:
+    """
+    Адреса текущей страницы на всех языках для <link rel="alternate" hreflang>.
+
+    Returns:
+        Словарь {язык: путь} с ключом x-default для адреса без префикса
+        или пустой словарь, если страница не поддерживает префикс языка
+    """
+    endpoint = request.endpoint
+    if not endpoint or not current_app.url_map.is_endpoint_expecting(endpoint, "lang_code"):
+        return {}
+
+    # Только пути: страницы кешируются без учёта Host, а абсолютный адрес
+    # для hreflang строится в шаблоне от SITE_URL из конфигурации
+    alternates = {
+        lang: url_for(endpoint, lang_code=lang)
+        for lang in SUPPORTED_LANGUAGES
+    }
+    alternates["x-default"] = url_for(endpoint, lang_code=None)
+    return alternates
+
+
 # Создаём объект приложения на уровне модуля, чтобы gunicorn app:app работал на платформах
 # где нельзя изменить команду запуска.
 app = create_app()
\ No newline at end of file
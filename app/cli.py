@@ -0,0 +1,54 @@
+"""
+CLI команды приложения (flask site ...).
+"""
+
+import os
+from pathlib import Path
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from app.database.snapshot import published_snapshot
+from app.utils.static_export import export_site
+
+site_cli = AppGroup('site', help='Публикация контента и статический экспорт публичных страниц.')
+
+
+@site_cli.command('export')
+@click.option('--output', '-o', type=click.Path(file_okay=False), default=None,
+              help='Папка экспорта (по умолчанию STATIC_EXPORT_DIR или build/site).')
+@click.option('--workers', '-w', type=int, default=None,
+              help='Количество потоков рендеринга (по умолчанию число CPU).')
+def export_command(output, workers) -> None:
+    """Рендер / и /catalog для всех языков вместе со статикой."""
+    output_dir = Path(output or current_app.config.get('STATIC_EXPORT_DIR') or 'build/site')
+    workers = workers or current_app.config.get('STATIC_EXPORT_WORKERS') or os.cpu_count() or 1
+
+    result = export_site(current_app._get_current_object(), output_dir, workers=workers)
+
+    click.echo(f"Экспорт в {output_dir}")
+    click.echo(f"  записано страниц:      {len(result.written)}")
+    click.echo(f"  без изменений:         {len(result.unchanged)}")
+    click.echo(f"  пропущено:             {len(result.skipped)}")
+    click.echo(f"  скопировано статики:   {result.assets_copied}")
+    click.echo(f"  копий картинок /img/:  {result.images_written}")
+
+
+@site_cli.command('publish')
+def publish_command() -> None:
+    """Опубликовать read-only снимок рабочей БД для публичных страниц."""
+    path = published_snapshot.publish()
+    click.echo(f"Снимок опубликован: {path}")
+    if not published_snapshot.enabled:
+        click.echo("Внимание: PUBLISHED_SNAPSHOT выключен, публичные страницы читают рабочую БД")
+
+
+def register_cli(app) -> None:
+    """
+    Регистрация CLI команд.
+
+    Args:
+        app: Экземпляр Flask приложения
+    """
+    app.cli.add_command(site_cli)
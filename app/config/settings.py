@@ -33,6 +33,14 @@ class Config:
     MAX_CONTENT_LENGTH: int = 16 * 1024 * 1024  # 16MB максимум
     UPLOAD_FOLDER: str = 'app/static/img'
     ALLOWED_EXTENSIONS: set = {'png', 'jpg', 'jpeg', 'webp', 'gif'}
+    # Ширины уменьшенных WebP-копий загруженных изображений (нужен Pillow)
+    IMAGE_VARIANT_WIDTHS: tuple = tuple(
+        int(width) for width in os.getenv('IMAGE_VARIANT_WIDTHS', '480,960,1600').split(',') if width.strip()
+    )
+    IMAGE_WEBP_QUALITY: int = int(os.getenv('IMAGE_WEBP_QUALITY', '80'))
+    # Дисковый кеш копий, уменьшенных по запросу (/img/<ширина>/...), в папке data
+    IMAGE_CACHE_MAX_MB: int = int(os.getenv('IMAGE_CACHE_MAX_MB', '256'))
+    IMAGE_CACHE_MAX_AGE: int = int(os.getenv('IMAGE_CACHE_MAX_AGE', str(365 * 24 * 3600)))
     
     # Настройки безопасности
     # SESSION_COOKIE_SECURE = True требует HTTPS. Для HTTP установите SECURE_COOKIES=false
@@ -61,6 +69,53 @@ class Config:
     SUPPORTED_LANGUAGES = ('ru', 'lv', 'en')
     DEFAULT_LANGUAGE = os.getenv('DEFAULT_LANGUAGE', 'ru')
     AUTO_TRANSLATION_ENABLED: bool = os.getenv('AUTO_TRANSLATION_ENABLED', 'false').lower() == 'true'
+    # Режим URL с префиксом языка (/ru/, /lv/, /en/): страницы без префикса
+    # перенаправляются на адрес с языком, а сами страницы не зависят от cookie
+    LOCALE_URL_PREFIX: bool = os.getenv('LOCALE_URL_PREFIX', 'false').lower() == 'true'
+    
+    # Настройки кеширования публичных страниц
+    # max-age для страниц с префиксом языка (0 - всегда перепроверять по ETag)
+    PAGE_CACHE_MAX_AGE: int = int(os.getenv('PAGE_CACHE_MAX_AGE', '0'))
+    
+    # Хранение публичного контента для чтения: columns - колонки value_<язык> таблицы content,
+    # rows - таблица content_values с одной строкой на (section, locale, key)
+    CONTENT_STORAGE: str = os.getenv('CONTENT_STORAGE', 'columns')
+    
+    # Публичные страницы читают контент из опубликованного read-only снимка data/published.db
+    # (flask site publish), а не из рабочей БД, в которую пишет админка
+    PUBLISHED_SNAPSHOT: bool = os.getenv('PUBLISHED_SNAPSHOT', 'false').lower() == 'true'
+    
+    # Профиль SQLite, применяется к каждому соединению
+    # WAL: чтение не блокируется записью из админки
+    SQLITE_JOURNAL_MODE: str = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+    # NORMAL в режиме WAL: fsync только при checkpoint, целостность БД сохраняется
+    SQLITE_SYNCHRONOUS: str = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_MMAP_SIZE: int = int(os.getenv('SQLITE_MMAP_SIZE', str(64 * 1024 * 1024)))
+    # Отрицательное значение - размер кеша страниц в КиБ на соединение
+    SQLITE_CACHE_SIZE: int = int(os.getenv('SQLITE_CACHE_SIZE', '-16000'))
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+    # Соединений в пуле воркера (по числу потоков gunicorn --threads)
+    SQLITE_POOL_SIZE: int = int(os.getenv('SQLITE_POOL_SIZE', '8'))
+    
+    # Максимум операций очереди записи (write_queue) в одной транзакции
+    DB_WRITE_BATCH_SIZE: int = int(os.getenv('DB_WRITE_BATCH_SIZE', '100'))
+    # Сколько поток запроса ждёт выполнения своей мутации в очереди записи, секунд
+    DB_WRITE_TIMEOUT: float = float(os.getenv('DB_WRITE_TIMEOUT', '30'))
+    
+    # Как часто воркер сверяет общую версию контента (data/content.version)
+    # и сбрасывает свои кеши после правок в других воркерах, мс
+    CONTENT_VERSION_CHECK_MS: int = int(os.getenv('CONTENT_VERSION_CHECK_MS', '500'))
+    
+    # Канонический адрес сайта для <link rel="alternate" hreflang> (https://oilfusion.com).
+    # Берётся из конфигурации, а не из заголовка Host: страницы кешируются для всех хостов
+    SITE_URL: str = os.getenv('SITE_URL', '')
+    
+    # Статический экспорт страниц (flask site export)
+    STATIC_EXPORT_DIR: Optional[str] = os.getenv('STATIC_EXPORT_DIR')
+    STATIC_EXPORT_WORKERS: int = int(os.getenv('STATIC_EXPORT_WORKERS', '0'))
+    STATIC_EXPORT_BASE_URL: str = os.getenv('STATIC_EXPORT_BASE_URL', 'http://localhost')
+    # Обновлять экспорт в фоне после каждого сохранения в админке
+    STATIC_EXPORT_ON_SAVE: bool = os.getenv('STATIC_EXPORT_ON_SAVE', 'false').lower() == 'true'
     
     @classmethod
     def init_app(cls, app):
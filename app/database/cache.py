@@ -0,0 +1,233 @@
+"""
+Кеши контента в памяти процесса.
+"""
+
+import json
+import threading
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+SectionKey = Tuple[str, str]
+
+
+def copy_json(value: Any) -> Any:
+    """
+    Глубокая копия значения из JSON (словари и списки; строки и числа неизменяемы).
+    Кеши отдают копии: правка вложенного списка в маршруте или шаблоне
+    не должна попасть в кеш и в ответы следующим запросам.
+    """
+    if isinstance(value, dict):
+        return {key: copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_json(item) for item in value]
+    return value
+
+
+class SectionCache:
+    """
+    Кеш словарей секций по ключу (section, locale).
+
+    Каждая секция имеет собственный номер версии, который увеличивается
+    при изменении её контента. Запись кеша считается актуальной, только
+    если была построена при текущей версии секции, поэтому правка одной
+    секции не сбрасывает кеш остальных.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[SectionKey, Tuple[int, Dict[str, Any]]] = {}
+        self._section_versions: Dict[str, int] = {}
+        # Версия секций, которые ещё не менялись; растёт при clear()
+        self._base_version = 0
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        """Общая версия контента, растёт при любом изменении."""
+        return self._version
+
+    def section_version(self, section: str) -> int:
+        """Текущая версия секции."""
+        return self._section_versions.get(section, self._base_version)
+
+    def section_versions(self) -> Tuple[int, Dict[str, int]]:
+        """
+        Снимок версий секций.
+
+        Returns:
+            Кортеж (версия неизменявшихся секций, версии изменявшихся секций)
+        """
+        with self._lock:
+            return self._base_version, dict(self._section_versions)
+
+    def get(self, section: str, locale: str) -> Optional[Dict[str, Any]]:
+        """
+        Получить секцию из кеша.
+
+        Args:
+            section: Секция
+            locale: Язык
+
+        Returns:
+            Копия закешированного словаря или None, если записи нет или она устарела
+        """
+        entry = self._entries.get((section, locale))
+        if entry is not None and entry[0] == self.section_version(section):
+            self.hits += 1
+            # Маршруты дополняют словарь секции (background и т.п.), а вложенные
+            # списки (features, services_list) могут изменить, поэтому копия глубокая
+            return copy_json(entry[1])
+        self.misses += 1
+        return None
+
+    def put(self, section: str, locale: str, data: Dict[str, Any], version: int) -> None:
+        """
+        Сохранить секцию в кеш.
+
+        Args:
+            section: Секция
+            locale: Язык
+            data: Готовый словарь секции
+            version: Версия секции, снятая до чтения из БД
+        """
+        with self._lock:
+            # Если секцию успели изменить во время чтения, данные уже устарели
+            if version != self.section_version(section):
+                return
+            self._entries[(section, locale)] = (version, copy_json(data))
+
+    def invalidate(self, section: str) -> None:
+        """Увеличить версию секции, делая её записи недействительными."""
+        with self._lock:
+            self._section_versions[section] = self.section_version(section) + 1
+            self._version += 1
+            for key in [key for key in self._entries if key[0] == section]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Сбросить все записи и увеличить версии всех секций."""
+        with self._lock:
+            for section in list(self._section_versions):
+                self._section_versions[section] += 1
+            self._base_version += 1
+            self._entries.clear()
+            self._version += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Статистика кеша."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'version': self._version,
+        }
+
+
+class JsonValueCache:
+    """
+    Кеш распарсенных JSON-значений контента по ключу (id записи, locale, updated_at).
+    Для content это id строки, для content_values - пара (section, key).
+
+    Для каждой пары (id, locale) хранится только последняя версия значения,
+    поэтому после правки старое значение вытесняется новым.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[Hashable, str], Tuple[Hashable, Any]] = {}
+
+    def loads(self, content_id: Hashable, locale: str, updated_at: Hashable, raw: str) -> Any:
+        """
+        Распарсить JSON-значение, используя кеш.
+
+        Args:
+            content_id: Идентификатор записи контента
+            locale: Язык
+            updated_at: Время (или кортеж времён) последнего изменения записи
+            raw: Строка JSON
+
+        Returns:
+            Копия распарсенного значения или пустой список, если это не валидный JSON
+            (как раньше в маршрутах: шаблоны не перебирают символы строки)
+        """
+        entry = self._values.get((content_id, locale))
+        if entry is not None and entry[0] == updated_at:
+            return copy_json(entry[1])
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.warning(f"Невалидный JSON в контенте {content_id} ({locale}), используется []")
+            value = []
+        with self._lock:
+            self._values[(content_id, locale)] = (updated_at, value)
+        return copy_json(value)
+
+    def clear(self) -> None:
+        """Сбросить все значения."""
+        with self._lock:
+            self._values.clear()
+
+
+class TableCache:
+    """
+    Кеш небольшой таблицы целиком одним словарём (настройки, изображения).
+
+    При первом обращении таблица читается целиком,
+    а любое изменение в ней сбрасывает словарь.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: Optional[Dict[str, Any]] = None
+        self._version = 0
+        self.loads = 0
+
+    @property
+    def version(self) -> int:
+        """Версия таблицы, растёт при каждом сбросе."""
+        return self._version
+
+    def get(self) -> Optional[Dict[str, Any]]:
+        """Словарь или None, если он ещё не загружен."""
+        return self._values
+
+    def put(self, values: Dict[str, Any], version: int) -> None:
+        """
+        Сохранить загруженный словарь.
+
+        Args:
+            values: Словарь, построенный из таблицы
+            version: Версия, снятая до чтения из БД
+        """
+        with self._lock:
+            # Если таблицу изменили во время чтения, данные уже устарели
+            if version != self._version:
+                return
+            self._values = values
+            self.loads += 1
+
+    def clear(self) -> None:
+        """Сбросить словарь."""
+        with self._lock:
+            self._values = None
+            self._version += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Статистика кеша."""
+        return {
+            'loaded': self._values is not None,
+            'keys': len(self._values or ()),
+            'loads': self.loads,
+        }
+
+
+# Глобальные инстансы кешей контента.
+section_cache = SectionCache()
+json_value_cache = JsonValueCache()
+settings_cache = TableCache()
+image_cache = TableCache()
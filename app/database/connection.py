@@ -3,11 +3,64 @@
 """
 
 from pathlib import Path
+from typing import Any, Dict, Mapping
+
 from flask_sqlalchemy import SQLAlchemy
 from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
 
 db = SQLAlchemy()
 
+# Допустимые значения PRAGMA, которые подставляются в SQL как есть
+_JOURNAL_MODES = {'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'}
+_SYNCHRONOUS_LEVELS = {'OFF', 'NORMAL', 'FULL', 'EXTRA'}
+
+
+def sqlite_profile(config: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Профиль SQLite из настроек приложения.
+
+    Args:
+        config: Конфигурация приложения (app.config или класс Config)
+
+    Returns:
+        Словарь с journal_mode, synchronous, mmap_size, cache_size, busy_timeout
+    """
+    journal_mode = str(config.get('SQLITE_JOURNAL_MODE', 'WAL')).upper()
+    synchronous = str(config.get('SQLITE_SYNCHRONOUS', 'NORMAL')).upper()
+    if journal_mode not in _JOURNAL_MODES:
+        raise ValueError(f"Недопустимый SQLITE_JOURNAL_MODE: {journal_mode}")
+    if synchronous not in _SYNCHRONOUS_LEVELS:
+        raise ValueError(f"Недопустимый SQLITE_SYNCHRONOUS: {synchronous}")
+    return {
+        'journal_mode': journal_mode,
+        'synchronous': synchronous,
+        'mmap_size': int(config.get('SQLITE_MMAP_SIZE', 0)),
+        'cache_size': int(config.get('SQLITE_CACHE_SIZE', -2000)),
+        'busy_timeout': int(config.get('SQLITE_BUSY_TIMEOUT_MS', 5000)),
+    }
+
+
+def apply_sqlite_profile(dbapi_connection, profile: Mapping[str, Any]) -> None:
+    """
+    Применение профиля к новому соединению SQLite (обработчик события connect).
+
+    Args:
+        dbapi_connection: Соединение sqlite3
+        profile: Профиль из sqlite_profile()
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        # busy_timeout первым: переключение в WAL само может ждать блокировку
+        cursor.execute(f"PRAGMA busy_timeout = {int(profile['busy_timeout'])}")
+        cursor.execute(f"PRAGMA journal_mode = {profile['journal_mode']}")
+        cursor.execute(f"PRAGMA synchronous = {profile['synchronous']}")
+        cursor.execute(f"PRAGMA mmap_size = {int(profile['mmap_size'])}")
+        cursor.execute(f"PRAGMA cache_size = {int(profile['cache_size'])}")
+    finally:
+        cursor.close()
+
 
 def init_db(app: Flask) -> None:
     """
@@ -25,30 +78,48 @@ def init_db(app: Flask) -> None:
     db_path = data_dir / 'oilfusion.db'
     data_dir.mkdir(parents=True, exist_ok=True)
     
-    is_new_db = not db_path.exists()
-    
     app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # Пул соединений на воркер: по одному на поток gthread, чтобы потоки
+    # не ждали друг друга, а страницы кеша SQLite переиспользовались
+    pool_size = app.config.get('SQLITE_POOL_SIZE', 8)
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {
+        'poolclass': QueuePool,
+        'pool_size': pool_size,
+        'max_overflow': pool_size,
+    })
     
     db.init_app(app)
+
+    # Общая для воркеров версия контента для сброса кешей после записи в других процессах
+    from app.database.version_stamp import content_version_stamp
+    content_version_stamp.init_app(
+        data_dir / 'content.version',
+        app.config.get('CONTENT_VERSION_CHECK_MS', 0),
+    )
     
     with app.app_context():
-        # Создаём все таблицы
-        db.create_all()
-        logger.info("Таблицы базы данных созданы")
-        
-        # Если БД новая или миграция не выполнена, запускаем миграцию
-        from app.database.migrations import migrate_json_to_db, create_default_data
-        from app.database.repositories import SettingRepository
-        
-        migration_completed = SettingRepository.get('migration_completed')
-        
-        if is_new_db or migration_completed != 'true':
-            logger.info("Запуск миграции данных из JSON в SQLite")
-            try:
-                migrate_json_to_db(data_dir)
-            except Exception as e:
-                logger.warning(f"Ошибка миграции JSON: {e}")
-                logger.info("Создание дефолтных данных")
-                create_default_data()
+        # WAL, mmap, cache_size и busy_timeout для каждого нового соединения
+        profile = sqlite_profile(app.config)
+        event.listen(db.engine, 'connect', lambda conn, _record: apply_sqlite_profile(conn, profile))
+        logger.info("Профиль SQLite: {}", profile)
+
+        # Таблицы и миграции данных: один процесс под файловой блокировкой,
+        # остальные воркеры ждут его и стартуют по быстрому пути
+        from app.database.migrations import run_startup_migrations
+        run_startup_migrations(data_dir)
+
+    # Очередь записи с одним потоком-писателем на процесс
+    from app.database.writer import write_queue
+    write_queue.init_app(app)
 
+    # Опубликованный read-only снимок для публичных страниц (PUBLISHED_SNAPSHOT)
+    from app.database.snapshot import published_snapshot
+    published_snapshot.init_app(
+        db_path,
+        data_dir / 'published.db',
+        app.config.get('PUBLISHED_SNAPSHOT', False),
+        app.config.get('CONTENT_VERSION_CHECK_MS', 0),
+    )
+    if published_snapshot.enabled and not (data_dir / 'published.db').exists():
+        published_snapshot.publish()
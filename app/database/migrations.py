@@ -6,13 +6,117 @@ import json
 from pathlib import Path
 from typing import Dict, Any
 
+from sqlalchemy import inspect
+from sqlalchemy.exc import OperationalError
+
 from app.database.connection import db
-from app.database.models import Content, Image, Translation, Setting
+from app.database.models import Content, ContentValue, Image, SchemaVersion, Translation, Setting
 from app.database.repositories import ContentRepository, ImageRepository, SettingRepository, TranslationRepository
+from app.i18n.const import DEFAULT_LANGUAGE, SUPPORTED_LANGUAGES
+from app.utils.file_lock import file_lock
 from app.utils.logger import get_logger
 
 logger = get_logger()
 
+# Текущая версия схемы и данных БД. Увеличивается при добавлении таблиц
+# или шагов миграции в _apply_migrations().
+SCHEMA_VERSION = 4
+
+
+def get_schema_version() -> int:
+    """
+    Версия схемы, записанная в БД.
+    
+    Returns:
+        Номер версии или 0, если таблицы schema_version ещё нет
+    """
+    try:
+        row = db.session.execute(db.text("SELECT version FROM schema_version WHERE id = 1")).first()
+    except OperationalError:
+        db.session.rollback()
+        return 0
+    return row[0] if row else 0
+
+
+def run_startup_migrations(data_dir: Path) -> None:
+    """
+    Создание таблиц и миграции данных при старте воркера.
+    Если версия схемы текущая, ничего не делается (один SELECT).
+    Иначе миграции выполняет один процесс под файловой блокировкой,
+    а остальные воркеры ждут блокировку и видят уже обновлённую версию.
+    
+    Args:
+        data_dir: Путь к папке data
+    """
+    if get_schema_version() == SCHEMA_VERSION:
+        logger.info(f"Схема БД актуальна (версия {SCHEMA_VERSION}), миграции пропущены")
+        return
+    
+    with file_lock(data_dir / 'migrations.lock'):
+        # Пока ждали блокировку, миграции мог выполнить другой воркер
+        version = get_schema_version()
+        if version == SCHEMA_VERSION:
+            logger.info("Миграции выполнены другим процессом")
+            return
+        
+        logger.info(f"Обновление схемы БД: версия {version} -> {SCHEMA_VERSION}")
+        _apply_migrations(data_dir)
+        
+        record = db.session.get(SchemaVersion, 1) or SchemaVersion(id=1, version=SCHEMA_VERSION)
+        record.version = SCHEMA_VERSION
+        db.session.add(record)
+        db.session.commit()
+
+
+def _apply_migrations(data_dir: Path) -> None:
+    """
+    Шаги миграции. Каждый шаг идемпотентен, поэтому БД любой старой
+    версии (в том числе без schema_version) доводится до текущей.
+    
+    Args:
+        data_dir: Путь к папке data
+    """
+    # Создаём все таблицы
+    db.create_all()
+    logger.info("Таблицы базы данных созданы")
+    
+    # create_all не добавляет колонки в существующие таблицы
+    _add_image_parent_column()
+    
+    # Если миграция не выполнена (в том числе для новой БД), переносим данные из JSON
+    if SettingRepository.get('migration_completed') != 'true':
+        logger.info("Запуск миграции данных из JSON в SQLite")
+        try:
+            migrate_json_to_db(data_dir)
+        except Exception as e:
+            logger.warning(f"Ошибка миграции JSON: {e}")
+            logger.info("Создание дефолтных данных")
+            create_default_data()
+    
+    # Заполняем content_values (одна строка на язык) для существующей БД
+    if Content.query.first() is not None and ContentValue.query.first() is None:
+        logger.info("Перенос контента в content_values")
+        migrate_content_to_locale_rows()
+    
+    # Собираем документы страниц (page_documents) из текущего контента
+    try:
+        ContentRepository.rebuild_page_documents()
+    except Exception as e:
+        logger.warning(f"Ошибка сборки документов страниц: {e}")
+
+
+def _add_image_parent_column() -> None:
+    """Добавление колонки images.parent_id (варианты изображений) в БД старой версии."""
+    columns = {column['name'] for column in inspect(db.engine).get_columns('images')}
+    if 'parent_id' in columns:
+        return
+    db.session.execute(db.text(
+        "ALTER TABLE images ADD COLUMN parent_id INTEGER REFERENCES images (id) ON DELETE CASCADE"
+    ))
+    db.session.execute(db.text("CREATE INDEX IF NOT EXISTS ix_images_parent_id ON images (parent_id)"))
+    db.session.commit()
+    logger.info("В таблицу images добавлена колонка parent_id")
+
 
 def migrate_json_to_db(data_dir: Path) -> None:
     """
@@ -126,7 +230,7 @@ def _migrate_content_files(data_dir: Path) -> None:
 
 def _migrate_section_data(section: str, data: Any, prefix: str = '') -> int:
     """
-    Рекурсивная миграция данных секции.
+    Миграция данных секции одним пакетом.
     
     Args:
         section: Название секции
@@ -136,7 +240,7 @@ def _migrate_section_data(section: str, data: Any, prefix: str = '') -> int:
     Returns:
         Количество мигрированных записей
     """
-    count = 0
+    rows = []
     
     if isinstance(data, dict):
         for key, value in data.items():
@@ -144,42 +248,38 @@ def _migrate_section_data(section: str, data: Any, prefix: str = '') -> int:
             
             if isinstance(value, (dict, list)):
                 # Сохраняем сложные структуры как JSON
-                ContentRepository.set(
-                    section=section,
-                    key=full_key,
-                    value_ru=json.dumps(value, ensure_ascii=False),
-                    data_type='json'
-                )
-                count += 1
+                rows.append({
+                    'section': section,
+                    'key': full_key,
+                    'value_ru': json.dumps(value, ensure_ascii=False),
+                    'data_type': 'json',
+                })
             elif isinstance(value, str):
-                ContentRepository.set(
-                    section=section,
-                    key=full_key,
-                    value_ru=value,
-                    data_type='text'
-                )
-                count += 1
+                rows.append({
+                    'section': section,
+                    'key': full_key,
+                    'value_ru': value,
+                    'data_type': 'text',
+                })
             elif value is not None:
                 # Преобразуем другие типы в строки
-                ContentRepository.set(
-                    section=section,
-                    key=full_key,
-                    value_ru=str(value),
-                    data_type='text'
-                )
-                count += 1
+                rows.append({
+                    'section': section,
+                    'key': full_key,
+                    'value_ru': str(value),
+                    'data_type': 'text',
+                })
     
     elif isinstance(data, list):
         # Для списков сохраняем как JSON
-        ContentRepository.set(
-            section=section,
-            key=prefix or 'data',
-            value_ru=json.dumps(data, ensure_ascii=False),
-            data_type='json'
-        )
-        count += 1
+        rows.append({
+            'section': section,
+            'key': prefix or 'data',
+            'value_ru': json.dumps(data, ensure_ascii=False),
+            'data_type': 'json',
+        })
     
-    return count
+    return ContentRepository.bulk_set(rows)
 
 
 def _migrate_images(data_dir: Path) -> None:
@@ -250,6 +350,53 @@ def _migrate_sections_visibility(visibility_file: Path) -> None:
         logger.error(f"Ошибка миграции настроек видимости: {exc}")
 
 
+def migrate_content_to_locale_rows() -> int:
+    """
+    Перенос контента из колонок value_<язык> таблицы content в content_values
+    (одна строка на section, locale, key). Повторный запуск синхронизирует
+    content_values с content: значения перезаписываются, удалённые ключи удаляются.
+    
+    Returns:
+        Количество записанных строк content_values
+    """
+    content_columns = {column['name'] for column in inspect(db.engine).get_columns('content')}
+    locales = [locale for locale in SUPPORTED_LANGUAGES if f'value_{locale}' in content_columns]
+    
+    total = 0
+    try:
+        for locale in locales:
+            is_default = locale == DEFAULT_LANGUAGE
+            # Имя колонки берётся из схемы таблицы, а не из ввода пользователя.
+            # WHERE обязателен: без него SQLite не разберёт INSERT ... SELECT ... ON CONFLICT
+            result = db.session.execute(db.text(f"""
+                INSERT INTO content_values (section, locale, key, value, data_type, updated_at)
+                SELECT section, :locale, key, value_{locale}, {'data_type' if is_default else 'NULL'}, updated_at
+                FROM content
+                WHERE {'1' if is_default else f'value_{locale} IS NOT NULL'}
+                ON CONFLICT(section, locale, key) DO UPDATE SET
+                    value = excluded.value,
+                    data_type = excluded.data_type,
+                    updated_at = excluded.updated_at
+            """), {'locale': locale})
+            total += result.rowcount
+        
+        db.session.execute(db.text("""
+            DELETE FROM content_values
+            WHERE NOT EXISTS (
+                SELECT 1 FROM content
+                WHERE content.section = content_values.section AND content.key = content_values.key
+            )
+        """))
+        db.session.commit()
+    except Exception as exc:
+        logger.error(f"Ошибка переноса контента в content_values: {exc}")
+        db.session.rollback()
+        raise
+    
+    logger.info(f"Перенесено {total} значений контента в content_values ({', '.join(locales)})")
+    return total
+
+
 def create_default_data() -> None:
     """
     Создание дефолтных данных при первом запуске, если JSON файлов нет.
@@ -262,20 +409,24 @@ def create_default_data() -> None:
     logger.info("Создание дефолтных данных для новой установки")
     
     try:
-        # Создаём базовый контент для Hero секции
-        ContentRepository.set('hero', 'slogan', value_ru='Balance in every drop', data_type='text')
-        ContentRepository.set('hero', 'subtitle', value_ru='Персонализированные масла на основе технологий AuraCloud® 3D и ДНК-тестирования', data_type='text')
-        ContentRepository.set('hero', 'cta_primary', value_ru='Подобрать масло', data_type='text')
-        ContentRepository.set('hero', 'cta_secondary', value_ru='Записаться', data_type='text')
-        ContentRepository.set('hero', 'scroll_text', value_ru='Прокрутите вниз', data_type='text')
-        
-        # Создаём базовый контент для секции Contacts
-        ContentRepository.set('contacts', 'title', value_ru='Контакты', data_type='text')
-        ContentRepository.set('contacts', 'subtitle', value_ru='Свяжитесь с нами для консультации', data_type='text')
-        ContentRepository.set('contacts', 'phone', value_ru='+7 (000) 000-00-00', data_type='text')
-        ContentRepository.set('contacts', 'email', value_ru='info@example.com', data_type='text')
-        ContentRepository.set('contacts', 'address', value_ru='Адрес не указан', data_type='text')
-        ContentRepository.set('contacts', 'form_title', value_ru='Записаться на консультацию', data_type='text')
+        # Создаём базовый контент для секций Hero и Contacts одним пакетом
+        default_content = [
+            ('hero', 'slogan', 'Balance in every drop'),
+            ('hero', 'subtitle', 'Персонализированные масла на основе технологий AuraCloud® 3D и ДНК-тестирования'),
+            ('hero', 'cta_primary', 'Подобрать масло'),
+            ('hero', 'cta_secondary', 'Записаться'),
+            ('hero', 'scroll_text', 'Прокрутите вниз'),
+            ('contacts', 'title', 'Контакты'),
+            ('contacts', 'subtitle', 'Свяжитесь с нами для консультации'),
+            ('contacts', 'phone', '+7 (000) 000-00-00'),
+            ('contacts', 'email', 'info@example.com'),
+            ('contacts', 'address', 'Адрес не указан'),
+            ('contacts', 'form_title', 'Записаться на консультацию'),
+        ]
+        ContentRepository.bulk_set(
+            {'section': section, 'key': key, 'value_ru': value, 'data_type': 'text'}
+            for section, key, value in default_content
+        )
         
         # Создаём базовые переводы
         _create_default_translations()
@@ -24,6 +24,8 @@ class Image(db.Model):
     mime_type = db.Column(db.String(100))
     width = db.Column(db.Integer)
     height = db.Column(db.Integer)
+    # Для уменьшенных и WebP-копий - id записи оригинала
+    parent_id = db.Column(db.Integer, db.ForeignKey('images.id', ondelete='CASCADE'), index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
@@ -84,6 +86,54 @@ class Content(db.Model):
         return f'<Content {self.section}.{self.key}>'
 
 
+class ContentValue(db.Model):
+    """
+    Значение контента на одном языке: одна строка на (section, locale, key).
+    
+    Таблица без rowid: первичный ключ (section, locale, key) является
+    кластерным индексом, поэтому чтение секции на одном языке читает
+    только байты этого языка. Новый язык добавляется без миграции схемы.
+    Тип данных (text, json, html) хранится в строке русского языка,
+    которая есть у каждого ключа.
+    """
+    __tablename__ = 'content_values'
+    
+    section = db.Column(db.String(100), primary_key=True)
+    locale = db.Column(db.String(10), primary_key=True)
+    key = db.Column(db.String(255), primary_key=True)
+    value = db.Column(db.Text, nullable=True)
+    data_type = db.Column(db.String(50), nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    __table_args__ = {'sqlite_with_rowid': False}
+    
+    def __repr__(self) -> str:
+        return f'<ContentValue {self.section}.{self.key} [{self.locale}]>'
+
+
+class PageDocument(db.Model):
+    """
+    Готовый документ страницы на одном языке: контент всех её секций
+    одним JSON ({секция: {ключ: значение}}, JSON-поля уже разобраны).
+    
+    Поддерживается ContentRepository в той же транзакции, что и сам контент:
+    при изменении секции пересобираются только её части в документах
+    страниц, куда она входит. Главная страница читает одну строку вместо
+    всех записей контента своих секций.
+    """
+    __tablename__ = 'page_documents'
+    
+    page = db.Column(db.String(50), primary_key=True)
+    locale = db.Column(db.String(10), primary_key=True)
+    payload = db.Column(db.Text, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    __table_args__ = {'sqlite_with_rowid': False}
+    
+    def __repr__(self) -> str:
+        return f'<PageDocument {self.page} [{self.locale}]>'
+
+
 class Translation(db.Model):
     """
     Модель для хранения переводов.
@@ -124,3 +174,17 @@ class Setting(db.Model):
     def __repr__(self) -> str:
         return f'<Setting {self.key}={self.value}>'
 
+
+class SchemaVersion(db.Model):
+    """
+    Версия схемы и данных БД (одна строка).
+    Если версия совпадает с текущей, воркер пропускает create_all и миграции при старте.
+    """
+    __tablename__ = 'schema_version'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def __repr__(self) -> str:
+        return f'<SchemaVersion {self.version}>'
@@ -3,23 +3,68 @@
 """
 
 import json
+from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+from flask import current_app
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import OperationalError
 from werkzeug.datastructures import FileStorage
 
+from app.database.cache import image_cache, json_value_cache, section_cache, settings_cache
 from app.database.connection import db
-from app.database.models import Content, Image, Setting, Translation
+from app.database.models import Content, ContentValue, Image, PageDocument, Setting, Translation
+from app.database.snapshot import published_snapshot
+from app.database.version_stamp import IMAGES, SETTINGS, content_version_stamp
+from app.database.writer import after_commit, commit, in_write_batch, queued_write, rollback
+from app.i18n.const import DEFAULT_LANGUAGE, SUPPORTED_LANGUAGES
 from app.utils.logger import get_logger
 
 logger = get_logger()
 
+# Страницы, для которых в page_documents хранится готовый документ,
+# и секции контента, из которых он собирается
+PAGE_SECTIONS: Dict[str, Tuple[str, ...]] = {
+    'index': (
+        'hero',
+        'about',
+        'products',
+        'services',
+        'personalization',
+        'reviews',
+        'blog',
+        'contacts',
+        'auracloud_slider',
+    ),
+}
+
+
+@dataclass(frozen=True)
+class ImageSet:
+    """Изображение с размерами и его копии разной ширины для srcset."""
+    
+    url: str
+    width: Optional[int]
+    height: Optional[int]
+    # (url, ширина) по возрастанию ширины, вместе с оригиналом
+    candidates: Tuple[Tuple[str, int], ...]
+
+
+def _images_changed() -> None:
+    """Сброс кеша изображений (в том числе в других воркерах) после фиксации записи."""
+    after_commit(image_cache.clear, key='images')
+    after_commit(partial(content_version_stamp.bump, IMAGES), key=('content_version', IMAGES))
+
 
 class ImageRepository:
     """Репозиторий для работы с изображениями."""
     
     @staticmethod
+    @queued_write
     def create(
         filename: str,
         original_filename: str,
@@ -29,7 +74,8 @@ class ImageRepository:
         size_bytes: int = 0,
         mime_type: Optional[str] = None,
         width: Optional[int] = None,
-        height: Optional[int] = None
+        height: Optional[int] = None,
+        parent_id: Optional[int] = None
     ) -> Image:
         """
         Создание новой записи изображения.
@@ -44,6 +90,7 @@ class ImageRepository:
             mime_type: MIME-тип файла
             width: Ширина изображения
             height: Высота изображения
+            parent_id: id оригинала, если это уменьшенная или WebP-копия
             
         Returns:
             Image: Созданная запись изображения
@@ -57,10 +104,12 @@ class ImageRepository:
             size_bytes=size_bytes,
             mime_type=mime_type,
             width=width,
-            height=height
+            height=height,
+            parent_id=parent_id
         )
         db.session.add(image)
-        db.session.commit()
+        commit()
+        _images_changed()
         logger.info(f"Изображение сохранено в БД: {filename} ({section}.{field})")
         return image
     
@@ -69,6 +118,53 @@ class ImageRepository:
         """Получение изображения по секции и полю."""
         return Image.query.filter_by(section=section, field=field).first()
     
+    @staticmethod
+    def get_image_set(url: str) -> Optional[ImageSet]:
+        """
+        Изображение и его копии по URL оригинала (из кеша в памяти).
+        
+        Args:
+            url: URL оригинала (/static/img/...)
+            
+        Returns:
+            ImageSet или None, если изображения нет в таблице images
+        """
+        image_sets = image_cache.get()
+        if image_sets is None:
+            version = image_cache.version
+            image_sets = ImageRepository._load_image_sets()
+            image_cache.put(image_sets, version)
+        return image_sets.get(url)
+    
+    @staticmethod
+    def _load_image_sets() -> Dict[str, ImageSet]:
+        """Вся таблица images одним запросом: оригиналы с копиями, по URL оригинала."""
+        table = Image.__table__
+        rows = db.session.execute(
+            select(table.c.id, table.c.parent_id, table.c.url, table.c.width, table.c.height)
+        ).all()
+        
+        variants: Dict[int, List[Tuple[str, int]]] = {}
+        for row in rows:
+            if row.parent_id is not None and row.width:
+                variants.setdefault(row.parent_id, []).append((row.url, row.width))
+        
+        image_sets = {}
+        for row in rows:
+            if row.parent_id is not None:
+                continue
+            candidates = {width: url for url, width in variants.get(row.id, [])}
+            # Оригинал нужен в srcset, только если нет копии той же ширины (WebP легче)
+            if row.width and row.width not in candidates:
+                candidates[row.width] = row.url
+            image_sets[row.url] = ImageSet(
+                url=row.url,
+                width=row.width,
+                height=row.height,
+                candidates=tuple((url, width) for width, url in sorted(candidates.items())),
+            )
+        return image_sets
+    
     @staticmethod
     def get_by_filename(filename: str) -> Optional[Image]:
         """Получение изображения по имени файла."""
@@ -80,32 +176,254 @@ class ImageRepository:
         return Image.query.filter_by(section=section).all()
     
     @staticmethod
+    @queued_write
     def update_url(section: str, field: str, url: str) -> Optional[Image]:
         """Обновление URL изображения."""
         image = ImageRepository.get_by_section_field(section, field)
         if image:
             image.url = url
             image.updated_at = datetime.utcnow()
-            db.session.commit()
+            commit()
+            _images_changed()
             logger.info(f"URL изображения обновлён: {section}.{field}")
         return image
     
     @staticmethod
+    @queued_write
     def delete(image_id: int) -> bool:
         """Удаление изображения из БД."""
         image = Image.query.get(image_id)
         if image:
             db.session.delete(image)
-            db.session.commit()
+            commit()
+            _images_changed()
             logger.info(f"Изображение удалено из БД: {image.filename}")
             return True
         return False
 
 
+def _localized_value(locale: str):
+    """
+    SQL-выражение значения на указанном языке с фоллбэком на русский,
+    как в Content.get_value(): пустой перевод заменяется на value_ru.
+    
+    Args:
+        locale: Язык (ru, lv, en)
+        
+    Returns:
+        Выражение COALESCE(NULLIF(value_<locale>, ''), value_ru)
+    """
+    table = Content.__table__
+    column = table.c.get(f'value_{locale}')
+    if column is None or locale == 'ru':
+        return table.c.value_ru.label('value')
+    return func.coalesce(func.nullif(column, ''), table.c.value_ru).label('value')
+
+
+def _content_changed(sections: Iterable[str]) -> None:
+    """
+    Сброс кешей секций и общей версии контента после фиксации записи.
+    В пакете очереди записи каждая секция и общая версия сбрасываются один раз.
+    """
+    for section in sections:
+        after_commit(lambda section=section: section_cache.invalidate(section), key=('section', section))
+    after_commit(content_version_stamp.bump, key='content_version')
+
+
+def _uses_locale_rows() -> bool:
+    """Читать ли публичный контент из content_values (CONTENT_STORAGE=rows)."""
+    return current_app.config.get('CONTENT_STORAGE', 'columns') == 'rows'
+
+
+def _localized_rows_select(locale: str):
+    """
+    SELECT значения на указанном языке из content_values с фоллбэком на русский.
+    Строка русского языка есть у каждого ключа, перевод присоединяется к ней
+    по первичному ключу (section, locale, key).
+    
+    Args:
+        locale: Язык
+        
+    Returns:
+        SELECT колонок (section, key, data_type, value, updated_at, updated_at_ru)
+    """
+    table = ContentValue.__table__
+    base = table.alias('base')
+    if locale == DEFAULT_LANGUAGE or locale not in SUPPORTED_LANGUAGES:
+        return select(
+            base.c.section,
+            base.c.key,
+            base.c.data_type,
+            base.c.value,
+            base.c.updated_at,
+            base.c.updated_at.label('updated_at_ru'),
+        ).where(base.c.locale == DEFAULT_LANGUAGE)
+    
+    localized = table.alias('localized')
+    return select(
+        base.c.section,
+        base.c.key,
+        base.c.data_type,
+        func.coalesce(func.nullif(localized.c.value, ''), base.c.value).label('value'),
+        localized.c.updated_at,
+        base.c.updated_at.label('updated_at_ru'),
+    ).select_from(
+        base.outerjoin(localized, and_(
+            localized.c.section == base.c.section,
+            localized.c.locale == locale,
+            localized.c.key == base.c.key,
+        ))
+    ).where(base.c.locale == DEFAULT_LANGUAGE)
+
+
+def _write_locale_rows(rows: List[Dict[str, Any]], updated_at: datetime) -> None:
+    """
+    Записать значения в content_values в текущей транзакции (без commit).
+    Строка русского языка пишется всегда и хранит data_type, остальные языки
+    из SUPPORTED_LANGUAGES - только если значение передано. Как и в Content,
+    None не затирает существующее значение.
+    
+    Args:
+        rows: Словари section, key, value_<язык>, data_type
+        updated_at: Время изменения
+    """
+    values = []
+    for row in rows:
+        for locale in SUPPORTED_LANGUAGES:
+            value = row.get(f'value_{locale}')
+            is_default = locale == DEFAULT_LANGUAGE
+            if value is None and not is_default:
+                continue
+            values.append({
+                'section': row['section'],
+                'locale': locale,
+                'key': row['key'],
+                'value': value,
+                'data_type': row.get('data_type', 'text') if is_default else None,
+                'updated_at': updated_at,
+            })
+    if not values:
+        return
+    
+    table = ContentValue.__table__
+    stmt = sqlite_insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.section, table.c.locale, table.c.key],
+        set_={
+            'value': func.coalesce(stmt.excluded.value, table.c.value),
+            'data_type': func.coalesce(stmt.excluded.data_type, table.c.data_type),
+            'updated_at': stmt.excluded.updated_at,
+        },
+    )
+    db.session.execute(stmt, values)
+
+
+def _read_sections(
+    sections: List[str],
+    locale: str,
+    execute: Callable[[Any], List[Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Чтение секций из БД без кеша секций, с разбором JSON-полей.
+    
+    Args:
+        sections: Секции
+        locale: Язык
+        execute: Функция выполнения запроса (рабочая БД или опубликованный снимок)
+        
+    Returns:
+        Словарь {секция: словарь с контентом} для всех запрошенных секций
+    """
+    result: Dict[str, Dict[str, Any]] = {section: {} for section in sections}
+    if _uses_locale_rows():
+        # Одна строка на (section, locale, key): читаются только байты нужного языка
+        query = _localized_rows_select(locale)
+        query = query.where(query.selected_columns.section.in_(sections))
+        rows = [
+            ((section, key), (updated_at, updated_at_ru), section, key, data_type, value)
+            for section, key, data_type, value, updated_at, updated_at_ru
+            in execute(query)
+        ]
+    else:
+        # Core SELECT только нужных колонок: без ORM-объектов и без колонок других языков
+        table = Content.__table__
+        query = select(
+            table.c.id,
+            table.c.updated_at,
+            table.c.section,
+            table.c.key,
+            table.c.data_type,
+            _localized_value(locale),
+        ).where(table.c.section.in_(sections))
+        rows = execute(query)
+    
+    for content_id, updated_at, section, key, data_type, value in rows:
+        if value and data_type == 'json':
+            # JSON разбирается один раз на правку записи, а не на каждый запрос
+            result[section][key] = json_value_cache.loads(content_id, locale, updated_at, value)
+        else:
+            result[section][key] = value
+    return result
+
+
+def _refresh_page_documents(sections: Iterable[str], rebuild: bool = False) -> int:
+    """
+    Пересобрать в текущей транзакции (без commit) документы страниц,
+    в которые входят изменённые секции. В существующем документе
+    заменяются только эти секции, остальные остаются как есть.
+    
+    Args:
+        sections: Изменённые секции
+        rebuild: Собрать документы заново целиком
+        
+    Returns:
+        Количество записанных документов
+    """
+    changed = set(sections)
+    table = PageDocument.__table__
+
+    def execute(query) -> List[Any]:
+        # Чтение в транзакции записи, а не из опубликованного снимка
+        return db.session.execute(query).all()
+
+    now = datetime.utcnow()
+    documents = []
+    for page, page_sections in PAGE_SECTIONS.items():
+        if not rebuild and changed.isdisjoint(page_sections):
+            continue
+        stored = {} if rebuild else dict(db.session.execute(
+            select(table.c.locale, table.c.payload).where(table.c.page == page)
+        ).all())
+        for locale in SUPPORTED_LANGUAGES:
+            payload = json.loads(stored[locale]) if locale in stored else {}
+            stale = [section for section in page_sections if section in changed or section not in payload]
+            payload.update(_read_sections(stale, locale, execute))
+            documents.append({
+                'page': page,
+                'locale': locale,
+                'payload': json.dumps(
+                    {section: payload[section] for section in page_sections},
+                    ensure_ascii=False,
+                ),
+                'updated_at': now,
+            })
+    if not documents:
+        return 0
+    
+    stmt = sqlite_insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.page, table.c.locale],
+        set_={'payload': stmt.excluded.payload, 'updated_at': stmt.excluded.updated_at},
+    )
+    db.session.execute(stmt, documents)
+    return len(documents)
+
+
 class ContentRepository:
     """Репозиторий для работы с мультиязычным контентом."""
     
     @staticmethod
+    @queued_write
     def set(
         section: str,
         key: str,
@@ -148,9 +466,79 @@ class ContentRepository:
                 data_type=data_type
             )
             db.session.add(content)
-        db.session.commit()
+        _write_locale_rows([{
+            'section': section,
+            'key': key,
+            'value_ru': value_ru,
+            'value_lv': value_lv,
+            'value_en': value_en,
+            'data_type': data_type,
+        }], datetime.utcnow())
+        _refresh_page_documents([section])
+        commit()
+        _content_changed([section])
         return content
     
+    @staticmethod
+    @queued_write
+    def bulk_set(rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Пакетная установка мультиязычного контента одним INSERT ... ON CONFLICT
+        в одной транзакции.
+        Как и в set(), значение None не перезаписывает существующий перевод.
+        
+        Args:
+            rows: Словари с ключами section, key и необязательными
+                value_ru, value_lv, value_en, data_type (по умолчанию text).
+                Значения value_<язык> для других языков из SUPPORTED_LANGUAGES
+                сохраняются только в content_values
+            
+        Returns:
+            Количество записанных строк
+        """
+        rows = list(rows)
+        now = datetime.utcnow()
+        values = [
+            {
+                'section': row['section'],
+                'key': row['key'],
+                'value_ru': row.get('value_ru'),
+                'value_lv': row.get('value_lv'),
+                'value_en': row.get('value_en'),
+                'data_type': row.get('data_type', 'text'),
+                'created_at': now,
+                'updated_at': now,
+            }
+            for row in rows
+        ]
+        if not values:
+            return 0
+        
+        table = Content.__table__
+        stmt = sqlite_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.section, table.c.key],
+            set_={
+                'value_ru': func.coalesce(stmt.excluded.value_ru, table.c.value_ru),
+                'value_lv': func.coalesce(stmt.excluded.value_lv, table.c.value_lv),
+                'value_en': func.coalesce(stmt.excluded.value_en, table.c.value_en),
+                'data_type': stmt.excluded.data_type,
+                'updated_at': stmt.excluded.updated_at,
+            },
+        )
+        try:
+            db.session.execute(stmt, values)
+            _write_locale_rows(rows, now)
+            _refresh_page_documents({row['section'] for row in values})
+            commit()
+        except Exception:
+            rollback()
+            raise
+        
+        _content_changed({row['section'] for row in values})
+        logger.info(f"Пакетно записано {len(values)} записей контента")
+        return len(values)
+    
     @staticmethod
     def get(section: str, key: str, locale: str = 'ru', default: Optional[str] = None) -> Optional[str]:
         """
@@ -165,15 +553,28 @@ class ContentRepository:
         Returns:
             Значение контента или default
         """
-        content = Content.query.filter_by(section=section, key=key).first()
-        if content:
-            return content.get_value(locale)
+        if _uses_locale_rows():
+            query = _localized_rows_select(locale)
+            base = query.selected_columns
+            query = query.where(base.section == section, base.key == key)
+            row = db.session.execute(query).first()
+            if row is not None:
+                return row.value
+            return default
+        
+        table = Content.__table__
+        row = db.session.execute(
+            select(_localized_value(locale)).where(table.c.section == section, table.c.key == key)
+        ).first()
+        if row is not None:
+            return row[0]
         return default
     
     @staticmethod
     def get_section(section: str, locale: str = 'ru') -> Dict[str, str]:
         """
         Получение всех данных секции для указанного языка.
+        Результат кешируется в памяти до изменения секции.
         
         Args:
             section: Секция
@@ -182,19 +583,129 @@ class ContentRepository:
         Returns:
             Словарь с контентом на указанном языке
         """
-        contents = Content.query.filter_by(section=section).all()
-        result = {}
-        for content in contents:
-            value = content.get_value(locale)
-            if value and content.data_type == 'json':
-                try:
-                    result[content.key] = json.loads(value)
-                except json.JSONDecodeError:
-                    result[content.key] = value
+        return ContentRepository.get_sections([section], locale)[section]
+    
+    @staticmethod
+    def _execute_public(query) -> List[Any]:
+        """
+        Выполнить чтение для публичных страниц: из опубликованного снимка,
+        если он включён и опубликован, иначе из рабочей БД.
+        """
+        with published_snapshot.connect() as connection:
+            if connection is not None:
+                return connection.execute(query).all()
+        return db.session.execute(query).all()
+    
+    @staticmethod
+    def get_sections(sections: Iterable[str], locale: str = 'ru') -> Dict[str, Dict[str, Any]]:
+        """
+        Получение нескольких секций одним запросом.
+        Секции, которых нет в кеше, читаются одним SELECT ... WHERE section IN (...),
+        причём фоллбэк на русский выполняется в SQL и из БД возвращается одно значение на строку.
+        
+        Args:
+            sections: Список секций
+            locale: Язык (ru, lv, en)
+            
+        Returns:
+            Словарь {секция: словарь с контентом} в порядке запрошенных секций
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        for section in dict.fromkeys(sections):
+            cached = section_cache.get(section, locale)
+            if cached is not None:
+                result[section] = cached
+            else:
+                missing.append(section)
+                result[section] = {}
+        
+        if not missing:
+            return result
+        
+        versions = {section: section_cache.section_version(section) for section in missing}
+        
+        result.update(_read_sections(missing, locale, ContentRepository._execute_public))
+        
+        for section in missing:
+            section_cache.put(section, locale, result[section], versions[section])
+        return result
+    
+    @staticmethod
+    def get_page(
+        page: str,
+        locale: str = 'ru',
+        sections: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Получение всех секций страницы из PAGE_SECTIONS.
+        Секции, которых нет в кеше, берутся из одной строки page_documents
+        (один JSON на страницу и язык) вместо чтения записей контента;
+        из документа извлекаются только запрошенные секции.
+        Если документа нет (старый снимок или БД до миграции), секции
+        читаются через get_sections().
+        
+        Args:
+            page: Страница (ключ PAGE_SECTIONS)
+            locale: Язык (ru, lv, en)
+            sections: Только эти секции страницы (например, видимые); по умолчанию все
+            
+        Returns:
+            Словарь {секция: словарь с контентом} в порядке запрошенных секций
+        """
+        sections = PAGE_SECTIONS[page] if sections is None else tuple(dict.fromkeys(sections))
+        result: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        for section in sections:
+            cached = section_cache.get(section, locale)
+            if cached is not None:
+                result[section] = cached
             else:
-                result[content.key] = value
+                missing.append(section)
+                result[section] = {}
+        
+        if not missing:
+            return result
+        if locale not in SUPPORTED_LANGUAGES:
+            return ContentRepository.get_sections(sections, locale)
+        
+        versions = {section: section_cache.section_version(section) for section in missing}
+        table = PageDocument.__table__
+        # json_extract вырезает в SQLite только нужные секции: остальные не разбираются в Python
+        query = select(
+            *[func.json_extract(table.c.payload, f'$."{section}"') for section in missing]
+        ).where(table.c.page == page, table.c.locale == locale)
+        try:
+            rows = ContentRepository._execute_public(query)
+        except OperationalError:
+            # Снимок, опубликованный до появления page_documents
+            rows = []
+        if not rows:
+            return ContentRepository.get_sections(sections, locale)
+        
+        for section, raw in zip(missing, rows[0]):
+            result[section] = json.loads(raw) if raw else {}
+            section_cache.put(section, locale, result[section], versions[section])
         return result
     
+    @staticmethod
+    @queued_write
+    def rebuild_page_documents() -> int:
+        """
+        Собрать заново документы всех страниц (после миграций и правок в обход репозитория).
+        
+        Returns:
+            Количество записанных документов
+        """
+        try:
+            count = _refresh_page_documents((), rebuild=True)
+            commit()
+        except Exception:
+            rollback()
+            raise
+        logger.info(f"Собрано {count} документов страниц")
+        return count
+    
     @staticmethod
     def get_content_object(section: str, key: str) -> Optional[Content]:
         """
@@ -210,20 +721,39 @@ class ContentRepository:
         return Content.query.filter_by(section=section, key=key).first()
     
     @staticmethod
+    @queued_write
     def delete(section: str, key: str) -> bool:
         """Удаление записи контента."""
         content = Content.query.filter_by(section=section, key=key).first()
         if content:
             db.session.delete(content)
-            db.session.commit()
+            db.session.execute(
+                ContentValue.__table__.delete().where(
+                    ContentValue.section == section,
+                    ContentValue.key == key,
+                )
+            )
+            _refresh_page_documents([section])
+            commit()
+            _content_changed([section])
             return True
         return False
+    
+    @staticmethod
+    def cache_stats() -> Dict[str, int]:
+        """Статистика кеша секций (попадания, промахи, версия контента)."""
+        return {
+            **section_cache.stats(),
+            'shared_version': content_version_stamp.stats(),
+            'published_snapshot': published_snapshot.stats(),
+        }
 
 
 class TranslationRepository:
     """Репозиторий для работы с переводами."""
     
     @staticmethod
+    @queued_write
     def set(key: str, locale: str, value: str, original_value: Optional[str] = None, source: str = 'manual') -> Translation:
         """
         Установка перевода.
@@ -254,7 +784,7 @@ class TranslationRepository:
                 source=source
             )
             db.session.add(translation)
-        db.session.commit()
+        commit()
         return translation
     
     @staticmethod
@@ -276,9 +806,14 @@ class TranslationRepository:
 
 
 class SettingRepository:
-    """Репозиторий для работы с настройками."""
+    """
+    Репозиторий для работы с настройками.
+    Чтения идут через settings_cache: все настройки загружаются одним запросом
+    и перечитываются только после изменения (в том числе в другом воркере).
+    """
     
     @staticmethod
+    @queued_write
     def set(key: str, value: str, value_type: str = 'string', description: Optional[str] = None) -> Setting:
         """Установка настройки."""
         setting = Setting.query.filter_by(key=key).first()
@@ -296,14 +831,37 @@ class SettingRepository:
                 description=description
             )
             db.session.add(setting)
-        db.session.commit()
+        commit()
+        after_commit(settings_cache.clear, key='settings')
+        # Отдельный счётчик: другие воркеры сбросят только кеш настроек
+        after_commit(partial(content_version_stamp.bump, SETTINGS), key=('content_version', SETTINGS))
         return setting
     
+    @staticmethod
+    def get_all() -> Dict[str, str]:
+        """
+        Все настройки (key -> value) из кеша, при промахе - одним запросом.
+        
+        Returns:
+            Словарь настроек (не изменять: он общий для потоков)
+        """
+        if in_write_batch():
+            # В пакете записи кеш сбрасывается только после commit,
+            # а операции должны видеть свои изменения
+            return dict(db.session.execute(select(Setting.key, Setting.value)).all())
+        
+        values = settings_cache.get()
+        if values is None:
+            version = settings_cache.version
+            values = dict(db.session.execute(select(Setting.key, Setting.value)).all())
+            settings_cache.put(values, version)
+        return values
+    
     @staticmethod
     def get(key: str, default: Optional[str] = None) -> Optional[str]:
         """Получение значения настройки."""
-        setting = Setting.query.filter_by(key=key).first()
-        return setting.value if setting else default
+        values = SettingRepository.get_all()
+        return values[key] if key in values else default
     
     @staticmethod
     def get_bool(key: str, default: bool = False) -> bool:
@@ -323,4 +881,3 @@ class SettingRepository:
             return int(value)
         except ValueError:
             return default
-
@@ -0,0 +1,192 @@
+"""
+Опубликованный снимок БД для публичных страниц.
+
+Админка и скрипты пишут в рабочую БД (data/oilfusion.db). Шаг публикации
+копирует её через sqlite backup API в отдельный файл, сжимает VACUUM и
+атомарно подменяет data/published.db. Публичные чтения открывают снимок
+с ?immutable=1&mode=ro: SQLite не берёт блокировок и не проверяет
+изменения файла, а сам файл целиком отображается в память.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine
+
+from app.database.cache import section_cache
+from app.utils.file_lock import file_lock
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+
+class PublishedSnapshot:
+    """Read-only снимок контента, общий для воркеров."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._path: Optional[Path] = None
+        self._source: Optional[Path] = None
+        self._enabled = False
+        self._interval = 0.0
+        self._checked_at = 0.0
+        self._file_state: Optional[Tuple[int, int]] = None
+        self._engine: Optional[Engine] = None
+        self.reloads = 0
+
+    def init_app(self, source: Path, path: Path, enabled: bool, check_interval_ms: int = 0) -> None:
+        """
+        Настройка снимка.
+
+        Args:
+            source: Путь к рабочей БД
+            path: Путь к файлу снимка
+            enabled: Читать ли публичный контент из снимка
+            check_interval_ms: Минимальный интервал между проверками подмены файла
+        """
+        self._source = Path(source)
+        self._path = Path(path)
+        self._enabled = enabled
+        self._interval = check_interval_ms / 1000
+        self._reset()
+
+    @property
+    def enabled(self) -> bool:
+        """Включено ли чтение из снимка."""
+        return self._enabled
+
+    def _read_file_state(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self._path.stat()
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _reset(self) -> None:
+        """Закрыть соединения со старым файлом снимка."""
+        with self._lock:
+            engine, self._engine = self._engine, None
+            self._file_state = None
+        if engine is not None:
+            engine.dispose()
+
+    def _make_engine(self) -> Engine:
+        # Файл не меняется после публикации: отображаем его в память целиком
+        mmap_size = max(self._path.stat().st_size, 1)
+        engine = create_engine(f'sqlite:///file:{self._path}?immutable=1&mode=ro&uri=true')
+
+        def _on_connect(dbapi_connection, _record) -> None:
+            dbapi_connection.execute(f"PRAGMA mmap_size = {mmap_size}")
+
+        event.listen(engine, 'connect', _on_connect)
+        return engine
+
+    def check(self) -> bool:
+        """
+        Проверить, не подменили ли снимок (в том числе в другом воркере),
+        не чаще заданного интервала. При подмене соединения переоткрываются,
+        а кеш секций сбрасывается.
+
+        Returns:
+            True если снимок был подменён
+        """
+        if not self._enabled:
+            return False
+        now = time.monotonic()
+        if now - self._checked_at < self._interval:
+            return False
+        self._checked_at = now
+
+        state = self._read_file_state()
+        if state == self._file_state:
+            return False
+        had_snapshot = self._file_state is not None or self._engine is not None
+        self._reset()
+        with self._lock:
+            self._file_state = state
+        if had_snapshot or state is not None:
+            self.reloads += 1
+            section_cache.clear()
+            logger.info("Опубликованный снимок БД обновлён")
+        return True
+
+    @contextmanager
+    def connect(self) -> Iterator[Optional[Connection]]:
+        """
+        Соединение со снимком.
+
+        Yields:
+            Соединение или None, если снимок выключен или ещё не опубликован
+        """
+        if not self._enabled:
+            yield None
+            return
+        with self._lock:
+            if self._engine is None:
+                state = self._read_file_state()
+                if state is None:
+                    engine = None
+                else:
+                    self._file_state = state
+                    engine = self._engine = self._make_engine()
+            else:
+                engine = self._engine
+        if engine is None:
+            yield None
+            return
+        with engine.connect() as connection:
+            yield connection
+
+    def publish(self) -> Path:
+        """
+        Опубликовать снимок рабочей БД: backup API, VACUUM и атомарная подмена файла.
+
+        Returns:
+            Путь к опубликованному снимку
+        """
+        if self._path is None or self._source is None:
+            raise RuntimeError("Снимок БД не настроен: вызовите init_app()")
+
+        started = time.perf_counter()
+        tmp_path = self._path.with_name(f'.{self._path.name}.tmp')
+        with file_lock(self._path.with_name(self._path.name + '.lock')):
+            tmp_path.unlink(missing_ok=True)
+            source = sqlite3.connect(self._source)
+            target = sqlite3.connect(tmp_path)
+            try:
+                # Согласованная копия на момент начала чтения, даже во время записи из админки
+                source.backup(target)
+                # Снимок открывается как immutable, поэтому WAL ему не нужен
+                target.execute("PRAGMA journal_mode = DELETE")
+                target.execute("VACUUM")
+            finally:
+                target.close()
+                source.close()
+            os.replace(tmp_path, self._path)
+
+        # В текущем процессе подхватываем снимок сразу, остальные воркеры - по check()
+        self._checked_at = 0.0
+        self.check()
+        logger.info(
+            "Снимок БД опубликован: {} ({} байт, {:.0f} мс)",
+            self._path, self._path.stat().st_size, (time.perf_counter() - started) * 1000,
+        )
+        return self._path
+
+    def stats(self) -> Dict[str, object]:
+        """Статистика снимка."""
+        return {
+            'enabled': self._enabled,
+            'published': self._file_state is not None,
+            'reloads': self.reloads,
+        }
+
+
+# Глобальный инстанс опубликованного снимка.
+published_snapshot = PublishedSnapshot()
@@ -0,0 +1,154 @@
+"""
+Общая для всех воркеров версия контента.
+
+Каждый воркер gunicorn держит свои кеши в памяти процесса. После записи
+в БД воркер увеличивает счётчик в файле data/content.version, а остальные
+воркеры читают его через mmap (без обращения к БД) не чаще раза в
+CONTENT_VERSION_CHECK_MS и сбрасывают свои кеши, если счётчик изменился.
+
+В файле по отдельному счётчику на вид данных (контент, настройки,
+изображения): запись настроек сбрасывает в других воркерах только кеш
+настроек, а не кеши контента, страниц и фрагментов.
+"""
+
+import mmap
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.database.cache import image_cache, section_cache, settings_cache
+from app.utils.file_lock import file_lock
+
+_COUNTER = struct.Struct('<Q')
+
+# Счётчики в файле по порядку и кеши, которые сбрасываются при их изменении.
+# Новые счётчики добавляются только в конец: старый файл дополняется нулями
+CONTENT = 'content'
+SETTINGS = 'settings'
+IMAGES = 'images'
+_SLOTS = (
+    (CONTENT, section_cache),
+    (SETTINGS, settings_cache),
+    (IMAGES, image_cache),
+)
+_FILE_SIZE = _COUNTER.size * len(_SLOTS)
+_SLOT_INDEX = {name: index for index, (name, _) in enumerate(_SLOTS)}
+
+
+class ContentVersionStamp:
+    """Монотонные счётчики изменений в файле, общие для процессов."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._path: Optional[Path] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._interval = 0.0
+        self._checked_at = 0.0
+        self._seen: List[int] = [0] * len(_SLOTS)
+        self.invalidations = 0
+
+    def init_app(self, path: Path, check_interval_ms: int = 0) -> None:
+        """
+        Открыть файл счётчиков, создав или дополнив его при необходимости.
+
+        Args:
+            path: Путь к файлу счётчиков
+            check_interval_ms: Минимальный интервал между проверками счётчиков
+        """
+        path = Path(path)
+        with file_lock(self._lock_path(path)):
+            size = path.stat().st_size if path.exists() else 0
+            if size < _FILE_SIZE:
+                # Файл прежнего формата (один счётчик) сохраняет своё значение
+                with open(path, 'ab') as handle:
+                    handle.write(bytes(_FILE_SIZE - size))
+
+        with open(path, 'rb') as handle:
+            counter_map = mmap.mmap(handle.fileno(), _FILE_SIZE, access=mmap.ACCESS_READ)
+
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+            self._path = path
+            self._mmap = counter_map
+            self._interval = check_interval_ms / 1000
+            self._seen = self._read()
+
+    @staticmethod
+    def _lock_path(path: Path) -> Path:
+        return path.with_name(path.name + '.lock')
+
+    def _read(self) -> List[int]:
+        return [_COUNTER.unpack_from(self._mmap, index * _COUNTER.size)[0] for index in range(len(_SLOTS))]
+
+    @property
+    def value(self) -> int:
+        """Последнее значение счётчика контента, увиденное этим процессом."""
+        return self._seen[_SLOT_INDEX[CONTENT]]
+
+    def bump(self, slot: str = CONTENT) -> int:
+        """
+        Увеличить счётчик после записи в этом процессе.
+
+        Args:
+            slot: Вид данных (CONTENT, SETTINGS или IMAGES)
+
+        Returns:
+            Новое значение счётчика (0, если счётчики не инициализированы)
+        """
+        if self._path is None:
+            return 0
+        index = _SLOT_INDEX[slot]
+        offset = index * _COUNTER.size
+        with file_lock(self._lock_path(self._path)):
+            with open(self._path, 'r+b') as handle:
+                handle.seek(offset)
+                value = _COUNTER.unpack(handle.read(_COUNTER.size))[0] + 1
+                handle.seek(offset)
+                handle.write(_COUNTER.pack(value))
+        with self._lock:
+            # Свои изменения уже сброшены точечно; полный сброс нужен,
+            # только если между ними успели записать другие воркеры
+            if value == self._seen[index] + 1:
+                self._seen[index] = value
+        return value
+
+    def check(self) -> bool:
+        """
+        Сверить счётчики с общим файлом и сбросить кеши данных, которые
+        изменили в другом процессе. Проверка не чаще заданного интервала.
+
+        Returns:
+            True если кеши были сброшены
+        """
+        if self._mmap is None:
+            return False
+        now = time.monotonic()
+        if now - self._checked_at < self._interval:
+            return False
+        self._checked_at = now
+
+        values = self._read()
+        with self._lock:
+            changed = [index for index, value in enumerate(values) if value != self._seen[index]]
+            if not changed:
+                return False
+            self._seen = values
+            self.invalidations += 1
+        # Кеши страниц и фрагментов проверяют версии section_cache и image_cache
+        for index in changed:
+            _SLOTS[index][1].clear()
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """Статистика счётчиков."""
+        return {
+            **{name: self._seen[index] for name, index in _SLOT_INDEX.items()},
+            'invalidations': self.invalidations,
+        }
+
+
+# Глобальный инстанс общей версии контента.
+content_version_stamp = ContentVersionStamp()
@@ -0,0 +1,250 @@
+"""
+Очередь записи в БД с одним потоком-писателем.
+
+Мутации репозиториев, отправленные через write_queue.submit(), выполняются
+по очереди в отдельном потоке. Накопившиеся операции группируются в одну
+транзакцию: каждая выполняется в своём SAVEPOINT, поэтому ошибка одной
+операции не откатывает остальные, а commit (и fsync) выполняется один на пакет.
+Потоки запросов не конкурируют за блокировку записи SQLite.
+
+Мутации репозиториев помечены декоратором @queued_write: вызов из потока
+запроса сам ставится в очередь и ждёт результата, поэтому вызывающему коду
+(маршрутам, скриптам) не нужно знать об очереди.
+
+Usage:
+    future = write_queue.submit(ContentRepository.set, 'hero', 'slogan', value_ru='...')
+    content = future.result(timeout=5)
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+from functools import wraps
+from typing import Any, Callable, Hashable, List, Optional, Tuple, TypeVar
+
+from flask import Flask, current_app, has_app_context
+
+from app.database.connection import db
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+# Состояние пакета записи в потоке-писателе
+_batch = threading.local()
+
+
+def in_write_batch() -> bool:
+    """Выполняется ли код внутри пакета потока-писателя."""
+    return getattr(_batch, 'hooks', None) is not None
+
+
+def commit() -> None:
+    """
+    Зафиксировать изменения репозитория.
+    Внутри пакета только flush: commit выполнит поток-писатель для всего пакета.
+    """
+    if in_write_batch():
+        db.session.flush()
+    else:
+        db.session.commit()
+
+
+def rollback() -> None:
+    """
+    Откатить изменения после ошибки.
+    Внутри пакета откат SAVEPOINT операции выполняет поток-писатель.
+    """
+    if not in_write_batch():
+        db.session.rollback()
+
+
+def after_commit(callback: Callable[[], None], key: Optional[Hashable] = None) -> None:
+    """
+    Выполнить действие (сброс кешей и т.п.) после фиксации транзакции.
+    Вне пакета выполняется сразу, внутри - после commit пакета.
+
+    Args:
+        callback: Функция без аргументов
+        key: Ключ для объединения: в пакете действие с одним ключом выполняется один раз
+    """
+    if in_write_batch():
+        _batch.hooks.setdefault(key if key is not None else object(), callback)
+    else:
+        callback()
+
+
+WriteTask = Tuple[Future, Callable[..., Any], tuple, dict]
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+def queued_write(func: F) -> F:
+    """
+    Декоратор мутации репозитория: выполнить через очередь записи и дождаться
+    результата (исключение операции пробрасывается вызывающему).
+    Сразу, без очереди, метод выполняется внутри пакета потока-писателя
+    и пока очередь не привязана к текущему приложению - при стартовых
+    миграциях, которые идут под файловой блокировкой до write_queue.init_app().
+
+    Usage:
+        @staticmethod
+        @queued_write
+        def set(section, key, ...):
+            ...
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if in_write_batch() or not write_queue.serves_current_app():
+            return func(*args, **kwargs)
+        return write_queue.submit(func, *args, **kwargs).result(timeout=write_queue.timeout)
+
+    return wrapper  # type: ignore[return-value]
+
+
+class WriteQueue:
+    """Очередь мутаций с одним потоком-писателем на процесс."""
+
+    def __init__(self, max_batch: int = 100) -> None:
+        self._queue: "queue.Queue[WriteTask]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._app: Optional[Flask] = None
+        self._thread: Optional[threading.Thread] = None
+        self._max_batch = max_batch
+        self.timeout = 30.0
+        self.batches = 0
+        self.operations = 0
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Привязка к приложению (поток-писатель работает в его контексте).
+
+        Args:
+            app: Экземпляр Flask приложения
+        """
+        self._app = app
+        self._max_batch = app.config.get('DB_WRITE_BATCH_SIZE', self._max_batch)
+        self.timeout = app.config.get('DB_WRITE_TIMEOUT', self.timeout)
+
+    def serves_current_app(self) -> bool:
+        """Привязана ли очередь к приложению текущего контекста."""
+        return (
+            self._app is not None
+            and has_app_context()
+            and current_app._get_current_object() is self._app
+        )
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Поставить мутацию в очередь.
+
+        Args:
+            func: Метод репозитория (ContentRepository.set и т.п.)
+            *args: Позиционные аргументы
+            **kwargs: Именованные аргументы
+
+        Returns:
+            Future с результатом метода или его исключением
+        """
+        future: Future = Future()
+        if in_write_batch():
+            # Вызов из самой операции пакета: выполняем сразу, иначе поток ждал бы сам себя
+            try:
+                future.set_result(func(*args, **kwargs))
+            except Exception as exc:
+                future.set_exception(exc)
+            return future
+
+        if self._app is None:
+            raise RuntimeError("Очередь записи не привязана к приложению: вызовите init_app()")
+        self._ensure_thread()
+        self._queue.put((future, func, args, kwargs))
+        return future
+
+    def _ensure_thread(self) -> None:
+        # Поток запускается при первой записи, а не при импорте: gunicorn форкает воркеры
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='db-writer', daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            tasks = [self._queue.get()]
+            # Всё, что накопилось, пока выполнялся предыдущий пакет, пишем одной транзакцией
+            while len(tasks) < self._max_batch:
+                try:
+                    tasks.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with self._app.app_context():
+                    self._execute(tasks)
+            except Exception as exc:  # noqa: BLE001
+                logger.error(f"Ошибка потока записи: {exc}")
+                for future, *_ in tasks:
+                    if not future.done():
+                        future.set_exception(exc)
+
+    def _execute(self, tasks: List[WriteTask]) -> None:
+        _batch.hooks = {}
+        results = []
+        try:
+            # Драйвер sqlite3 сам открывает транзакцию только перед DML, а SAVEPOINT вне
+            # транзакции фиксировался бы своим RELEASE. Открываем транзакцию явно;
+            # IMMEDIATE сразу берёт блокировку записи (с ожиданием busy_timeout)
+            db.session.execute(db.text('BEGIN IMMEDIATE'))
+            for future, func, args, kwargs in tasks:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                savepoint = db.session.begin_nested()
+                try:
+                    result = func(*args, **kwargs)
+                    savepoint.commit()
+                    results.append((future, result))
+                except Exception as exc:
+                    savepoint.rollback()
+                    future.set_exception(exc)
+
+            try:
+                db.session.commit()
+            except Exception as exc:
+                db.session.rollback()
+                logger.error(f"Ошибка фиксации пакета записи: {exc}")
+                for future, _ in results:
+                    future.set_exception(exc)
+                return
+
+            hooks = list(_batch.hooks.values())
+        finally:
+            _batch.hooks = None
+
+        for hook in hooks:
+            try:
+                hook()
+            except Exception as exc:  # noqa: BLE001
+                logger.error(f"Ошибка обработчика после записи: {exc}")
+
+        for future, result in results:
+            if isinstance(result, db.Model):
+                # Объект должен оставаться читаемым после закрытия сессии писателя
+                try:
+                    db.session.refresh(result)
+                    db.session.expunge(result)
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(f"Не удалось обновить результат записи: {exc}")
+            future.set_result(result)
+
+        self.batches += 1
+        self.operations += len(results)
+
+    def stats(self) -> dict:
+        """Статистика очереди."""
+        return {
+            'pending': self._queue.qsize(),
+            'batches': self.batches,
+            'operations': self.operations,
+        }
+
+
+# Глобальный инстанс очереди записи.
+write_queue = WriteQueue()
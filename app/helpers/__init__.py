@@ -2,9 +2,17 @@
 Хелперы приложения.
 """
 
-from app.helpers.content import get_content, get_section_content, inject_content_helper
+from app.helpers.content import get_content, get_section_content, inject_content_helper, prefetch_content
+from app.helpers.images import image_attrs, inject_image_helper
 
-__all__ = ['get_content', 'get_section_content', 'inject_content_helper']
+__all__ = [
+    'get_content',
+    'get_section_content',
+    'inject_content_helper',
+    'prefetch_content',
+    'image_attrs',
+    'inject_image_helper',
+]
 
 
 
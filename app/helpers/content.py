@@ -2,41 +2,92 @@
 Хелперы для работы с мультиязычным контентом.
 """
 
+import json
 from flask import g
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 from app.database import ContentRepository
 from app.i18n import DEFAULT_LANGUAGE
+from app.utils.fragment_cache import track_content_dependency
+
+# Секции, к которым обращается каркас страницы (base.html и подвал) на любой странице
+LAYOUT_CONTENT_SECTIONS = ('nav', 'footer')
+
+
+def prefetch_content(sections: Iterable[str]) -> None:
+    """
+    Указать секции, которые шаблоны текущей страницы прочитают через get_content.
+    При первом вызове хелпера они загружаются одним запросом вместе с секциями
+    каркаса; остальные секции загружаются по одной, только если к ним обратились.
+
+    Args:
+        sections: Секции контента (например, данные видимых секций лендинга)
+    """
+    g._content_prefetch = tuple(sections)
+
+
+def _get_content_map(section: str, locale: str) -> Dict[str, Any]:
+    """
+    Получить контент секции из карты, привязанной к текущему запросу.
+
+    Args:
+        section: Секция
+        locale: Язык
+
+    Returns:
+        Словарь с контентом секции
+    """
+    track_content_dependency(section)
+    content_map = g.get('_content_map')
+    if content_map is None:
+        content_map = g._content_map = {}
+
+    if (section, locale) not in content_map:
+        prefetch = LAYOUT_CONTENT_SECTIONS + g.get('_content_prefetch', ())
+        sections = prefetch if section in prefetch else (section,)
+        missing = [name for name in sections if (name, locale) not in content_map]
+        for name, data in ContentRepository.get_sections(missing, locale).items():
+            content_map[(name, locale)] = data
+    return content_map[(section, locale)]
 
 
 def get_content(section: str, key: str, default: str = '') -> str:
     """
     Получить контент на текущем языке пользователя.
-    
+    Секции загружаются один раз за запрос, повторные вызовы — поиск в словаре.
+
     Args:
         section: Секция (hero, about, products, etc.)
         key: Ключ контента
         default: Значение по умолчанию
-        
+
     Returns:
         Контент на текущем языке или fallback на русский
     """
     locale = getattr(g, 'locale', DEFAULT_LANGUAGE)
-    return ContentRepository.get(section, key, locale, default)
+    section_data = _get_content_map(section, locale)
+    if key not in section_data:
+        return default
+
+    value = section_data[key]
+    # JSON-поля в карте уже распарсены, а хелпер всегда отдаёт строку
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
 
 
 def get_section_content(section: str) -> Dict[str, Any]:
     """
     Получить весь контент секции на текущем языке.
-    
+
     Args:
         section: Секция (hero, about, products, etc.)
-        
+
     Returns:
         Словарь с контентом секции на текущем языке
     """
     locale = getattr(g, 'locale', DEFAULT_LANGUAGE)
-    return ContentRepository.get_section(section, locale)
+    return dict(_get_content_map(section, locale))
 
 
 def inject_content_helper():
@@ -47,7 +98,3 @@ def inject_content_helper():
         'get_content': get_content,
         'get_section_content': get_section_content,
     }
-
-
-
-
@@ -0,0 +1,149 @@
+"""
+Хелперы для адаптивных изображений.
+"""
+
+from typing import List, Optional, Tuple
+
+from markupsafe import Markup, escape
+
+from app.database.repositories import ImageRepository, ImageSet
+from app.utils.image_resize import resized_images
+
+# sizes по умолчанию: изображение во всю ширину экрана
+DEFAULT_SIZES = '100vw'
+
+
+def _image_set(url: str) -> Optional[ImageSet]:
+    """
+    Копии изображения: из таблицы images, а для картинок из static без
+    записанных копий - уменьшаемые по запросу через /img/<ширина>/.
+    """
+    if not url:
+        return None
+    image_set = ImageRepository.get_image_set(url)
+    if image_set is None or len(image_set.candidates) < 2:
+        image_set = resized_images.image_set(url) or image_set
+    return image_set
+
+
+def image_attrs(url: str, sizes: str = DEFAULT_SIZES) -> Markup:
+    """
+    Атрибуты src, srcset, sizes, width и height для тега <img>.
+    Копии разной ширины берутся из таблицы images (кеш в памяти) или
+    уменьшаются по запросу, поэтому браузер выбирает самый лёгкий подходящий
+    файл, а размеры исключают сдвиг вёрстки. Для внешних URL только src.
+
+    Args:
+        url: URL оригинала
+        sizes: Значение атрибута sizes (ширина изображения в вёрстке)
+
+    Returns:
+        Строка атрибутов
+
+    Usage:
+        <img {{ image_attrs(product.image, '(max-width: 768px) 100vw, 33vw') }} alt="...">
+    """
+    attrs = [f'src="{escape(url or "")}"']
+    image_set = _image_set(url)
+    if image_set is not None:
+        if len(image_set.candidates) > 1:
+            srcset = ', '.join(f'{candidate} {width}w' for candidate, width in image_set.candidates)
+            attrs.append(f'srcset="{escape(srcset)}"')
+            attrs.append(f'sizes="{escape(sizes)}"')
+        if image_set.width and image_set.height:
+            attrs.append(f'width="{image_set.width}" height="{image_set.height}"')
+    return Markup(' '.join(attrs))
+
+
+def _css_url(url: str) -> str:
+    """url("...") с экранированием для CSS внутри <style>."""
+    escaped = url.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '').replace('<', '\\3c ')
+    return f'url("{escaped}")'
+
+
+def _background_ranges(url: str) -> List[Tuple[Optional[str], str, Optional[str]]]:
+    """
+    Диапазоны ширины экрана и файлы фона для них.
+    Для диапазона до ширины копии берётся эта копия (1x), а для экранов
+    с плотностью 2x - наименьшая копия не уже двойной ширины.
+
+    Args:
+        url: URL оригинала
+
+    Returns:
+        Список (media-запрос или None, файл для 1x, файл для 2x или None)
+    """
+    image_set = _image_set(url)
+    if image_set is None or len(image_set.candidates) < 2:
+        return [(None, url, None)]
+
+    candidates = image_set.candidates
+    ranges = []
+    for index, (candidate, width) in enumerate(candidates):
+        conditions = []
+        if index > 0:
+            conditions.append(f'(min-width: {candidates[index - 1][1] + 1}px)')
+        if index < len(candidates) - 1:
+            conditions.append(f'(max-width: {width}px)')
+        dense = next((other for other, other_width in candidates if other_width >= width * 2), candidates[-1][0])
+        ranges.append((' and '.join(conditions), candidate, dense if dense != candidate else None))
+    return ranges
+
+
+def background_image_css(selector: str, url: str) -> Markup:
+    """
+    <style> с фоновым изображением элемента: по медиа-запросу на каждую
+    копию из таблицы images и image-set() для экранов 2x. Для изображений
+    без копий - просто background-image: url(...).
+
+    Args:
+        selector: CSS-селектор элемента (#hero .hero-background)
+        url: URL оригинала
+
+    Returns:
+        Тег <style>
+    """
+    rules = [f'{selector} {{ background-image: {_css_url(url)}; }}']
+    for media, candidate, dense in _background_ranges(url):
+        if media is None:
+            continue
+        declaration = f'background-image: {_css_url(candidate)};'
+        if dense:
+            # Браузеры без image-set() используют предыдущее объявление
+            declaration += f' background-image: image-set({_css_url(candidate)} 1x, {_css_url(dense)} 2x);'
+        rules.append(f'@media {media} {{ {selector} {{ {declaration} }} }}')
+    return Markup('<style>\n{}\n</style>'.format('\n'.join(rules)))
+
+
+def background_preload(url: str) -> Markup:
+    """
+    <link rel="preload"> для фонового изображения первого экрана (LCP).
+    Медиа-запросы и плотности совпадают с background_image_css(), поэтому
+    браузер заранее загружает ровно тот файл, который потом выберет CSS.
+
+    Args:
+        url: URL оригинала
+
+    Returns:
+        Теги <link rel="preload">
+    """
+    links = []
+    for media, candidate, dense in _background_ranges(url):
+        attrs = [f'href="{escape(candidate)}"']
+        if dense:
+            attrs.append(f'imagesrcset="{escape(candidate)} 1x, {escape(dense)} 2x"')
+        if media:
+            attrs.append(f'media="{escape(media)}"')
+        links.append(f'<link rel="preload" as="image" {" ".join(attrs)} fetchpriority="high">')
+    return Markup('\n'.join(links))
+
+
+def inject_image_helper():
+    """
+    Контекст-процессор для внедрения хелперов изображений в шаблоны.
+    """
+    return {
+        'image_attrs': image_attrs,
+        'background_image_css': background_image_css,
+        'background_preload': background_preload,
+    }
@@ -2,14 +2,19 @@
 Базовый класс для всех моделей контента.
 """
 import json
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 
 class BaseContentModel:
     """Базовый класс для управления контентом через JSON файлы."""
 
+    # Общие на процесс экземпляры моделей для чтения (см. shared())
+    _shared_instances: Dict[type, 'BaseContentModel'] = {}
+    _shared_lock = threading.Lock()
+
     def __init__(self, file_path: str):
         """
         Инициализация модели.
@@ -19,10 +24,43 @@ class BaseContentModel:
         """
         self.file_path = file_path
         self._data = {}
+        self._file_state: Optional[Tuple[int, int]] = None
         self._load_data()
 
+    @classmethod
+    def shared(cls) -> 'BaseContentModel':
+        """
+        Общий на процесс экземпляр модели для чтения на публичных страницах.
+        Файл перечитывается, только если изменились его mtime или размер.
+        
+        Returns:
+            Экземпляр модели с актуальными данными
+        """
+        with cls._shared_lock:
+            instance = cls._shared_instances.get(cls)
+            if instance is None:
+                instance = cls()
+                cls._shared_instances[cls] = instance
+            elif instance._read_file_state() != instance._file_state:
+                instance._load_data()
+            return instance
+
+    @property
+    def version(self) -> Optional[Tuple[int, int]]:
+        """Версия данных: (mtime_ns, размер) файла на момент последнего чтения или записи."""
+        return self._file_state
+
+    def _read_file_state(self) -> Optional[Tuple[int, int]]:
+        """Текущие mtime и размер JSON файла."""
+        try:
+            stat = Path(self.file_path).stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def _load_data(self) -> None:
         """Загрузка данных из JSON файла."""
+        self._file_state = self._read_file_state()
         try:
             if Path(self.file_path).exists():
                 with open(self.file_path, 'r', encoding='utf-8') as f:
@@ -42,6 +80,12 @@ class BaseContentModel:
             
             with open(self.file_path, 'w', encoding='utf-8') as f:
                 json.dump(self._data, f, ensure_ascii=False, indent=2)
+            self._file_state = self._read_file_state()
+            # Общий экземпляр перечитает файл при следующем обращении,
+            # даже если mtime не успел измениться
+            shared = self._shared_instances.get(type(self))
+            if shared is not None and shared is not self:
+                shared._file_state = None
             return True
         except Exception:
             return False
@@ -3,11 +3,9 @@
 Защищены JWT токеном в URL: /<token>/admin/...
 """
 
-from datetime import datetime
-from pathlib import Path
 from typing import Optional
 
-from flask import Blueprint, current_app, flash, redirect, render_template, request, url_for
+from flask import Blueprint, flash, redirect, render_template, request, url_for
 from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 
@@ -33,6 +31,7 @@ from app.models.products import ProductsContent
 from app.models.sections_visibility import SectionsVisibility
 from app.models.services import ServicesContent
 from app.utils.auth import require_admin_token
+from app.utils.image_pipeline import store_uploaded_image
 from app.utils.logger import get_logger
 
 logger = get_logger()
@@ -40,13 +39,21 @@ logger = get_logger()
 ALLOWED_IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'webp', 'gif'}
 
 
-def _save_uploaded_image(file: FileStorage, prefix: str) -> Optional[str]:
+def _save_uploaded_image(
+    file: FileStorage,
+    prefix: str,
+    section: Optional[str] = None,
+    field: str = 'image',
+) -> Optional[str]:
     """
-    Сохранение загруженного изображения в папку static/img.
+    Сохранение загруженного изображения в папку static/img
+    вместе с уменьшенными и WebP-копиями (см. image_pipeline).
 
     Args:
         file: Объект FileStorage из Flask.
-        prefix: Префикс для формирования имени файла.
+        prefix: Раздел админки, из которого загружен файл (секция по умолчанию).
+        section: Секция для записи в таблицу images (по умолчанию prefix).
+        field: Поле секции для записи в таблицу images.
 
     Returns:
         Относительный URL сохранённого файла или None, если файл не загружен.
@@ -66,15 +73,7 @@ def _save_uploaded_image(file: FileStorage, prefix: str) -> Optional[str]:
     if extension not in ALLOWED_IMAGE_EXTENSIONS:
         raise ValueError('Недопустимое расширение файла. Разрешены: PNG, JPG, JPEG, WEBP, GIF.')
 
-    upload_folder = Path(current_app.root_path) / 'static' / 'img'
-    upload_folder.mkdir(parents=True, exist_ok=True)
-
-    unique_filename = f"{prefix}_{int(datetime.now().timestamp())}_{filename}"
-    target_path = upload_folder / unique_filename
-    file.save(target_path)
-
-    logger.info(f"Изображение сохранено: {unique_filename}")
-    return f"/static/img/{unique_filename}"
+    return store_uploaded_image(file, section or prefix, field)
 
 
 # Создание Blueprint для админских маршрутов
@@ -138,7 +137,7 @@ def about_update(token):
     uploaded_background = request.files.get('background_image')
     if uploaded_background and uploaded_background.filename:
         try:
-            saved_url = _save_uploaded_image(uploaded_background, 'about')
+            saved_url = _save_uploaded_image(uploaded_background, 'about', field='background')
             if saved_url:
                 background_image_url = saved_url
         except ValueError as exc:
@@ -184,7 +183,7 @@ def about_feature_add(token):
     uploaded_feature = request.files.get('feature_image')
     if uploaded_feature and uploaded_feature.filename:
         try:
-            saved_url = _save_uploaded_image(uploaded_feature, 'feature')
+            saved_url = _save_uploaded_image(uploaded_feature, 'feature', 'about', 'feature_image')
             if saved_url:
                 feature_image_url = saved_url
         except ValueError as exc:
@@ -228,7 +227,7 @@ def about_feature_update(token, index):
     uploaded_feature = request.files.get('feature_image')
     if uploaded_feature and uploaded_feature.filename:
         try:
-            saved_url = _save_uploaded_image(uploaded_feature, 'feature')
+            saved_url = _save_uploaded_image(uploaded_feature, 'feature', 'about', 'feature_image')
             if saved_url:
                 feature_image_url = saved_url
         except ValueError as exc:
@@ -308,7 +307,7 @@ def personalization_update(token):
         uploaded = request.files.get(file_field)
         if uploaded and uploaded.filename:
             try:
-                saved_url = _save_uploaded_image(uploaded, prefix)
+                saved_url = _save_uploaded_image(uploaded, prefix, 'personalization', f'{prefix}_image')
                 if saved_url:
                     return saved_url
             except ValueError as exc:
@@ -501,10 +500,6 @@ def products_list(token):
 @admin_bp.route('/<token>/admin/products/save', methods=['POST'])
 @require_admin_token
 def products_save(token):
-    from pathlib import Path
-    from datetime import datetime
-    from werkzeug.utils import secure_filename
-
     products = ProductsContent()
     index = request.form.get('index')
     name = request.form.get('name', '')
@@ -517,12 +512,7 @@ def products_save(token):
     if 'image_file' in request.files:
         file = request.files['image_file']
         if file and file.filename and '.' in file.filename and file.filename.rsplit('.',1)[1].lower() in {'png','jpg','jpeg','webp','gif'}:
-            filename = secure_filename(file.filename)
-            unique = f"product_{int(datetime.now().timestamp())}_{filename}"
-            folder = Path('app/static/img')
-            folder.mkdir(parents=True, exist_ok=True)
-            file.save(str(folder / unique))
-            image_url = f"/static/img/{unique}"
+            image_url = store_uploaded_image(file, 'products', 'image')
 
     item = {
         'name': name,
@@ -560,10 +550,6 @@ def services_list(token):
 @admin_bp.route('/<token>/admin/services/save', methods=['POST'])
 @require_admin_token
 def services_save(token):
-    from pathlib import Path
-    from datetime import datetime
-    from werkzeug.utils import secure_filename
-
     services = ServicesContent()
     index = request.form.get('index')
     name = request.form.get('name', '')
@@ -578,12 +564,7 @@ def services_save(token):
     if 'icon_file' in request.files:
         file = request.files['icon_file']
         if file and file.filename and '.' in file.filename and file.filename.rsplit('.',1)[1].lower() in {'png','jpg','jpeg','webp','gif','svg'}:
-            filename = secure_filename(file.filename)
-            unique = f"service_{int(datetime.now().timestamp())}_{filename}"
-            folder = Path('app/static/img')
-            folder.mkdir(parents=True, exist_ok=True)
-            file.save(str(folder / unique))
-            icon_url = f"/static/img/{unique}"
+            icon_url = store_uploaded_image(file, 'services', 'icon')
 
     item = {
         'name': name,
@@ -673,7 +654,7 @@ def hero_save(token):
     uploaded_file = request.files.get('hero_background_image')
     if uploaded_file and uploaded_file.filename:
         try:
-            saved_url = _save_uploaded_image(uploaded_file, 'hero')
+            saved_url = _save_uploaded_image(uploaded_file, 'hero', field='background')
             if saved_url:
                 background_image_url = saved_url
         except ValueError as exc:
@@ -707,7 +688,7 @@ def hero_save(token):
     bottle_file = request.files.get('hero_bottle_image')
     if bottle_file and bottle_file.filename:
         try:
-            saved_bottle_url = _save_uploaded_image(bottle_file, 'hero_bottle')
+            saved_bottle_url = _save_uploaded_image(bottle_file, 'hero_bottle', 'hero', 'bottle_image')
             if saved_bottle_url:
                 bottle_image_url = saved_bottle_url
         except ValueError as exc:
@@ -870,25 +851,16 @@ def auracloud_slider_update(token):
     slider = AuraCloudSlider()
     
     # Обработка изображений
-    from pathlib import Path
-    from datetime import datetime
-    from werkzeug.utils import secure_filename
-    
-    def _save_image(prefix: str, file_field: str, fallback_url: str) -> str:
+    def _save_image(file_field: str, fallback_url: str) -> str:
         url = request.form.get(fallback_url, '')
         if file_field in request.files:
             file = request.files[file_field]
             if file and file.filename and '.' in file.filename and file.filename.rsplit('.', 1)[1].lower() in {'png','jpg','jpeg','webp','gif'}:
-                filename = secure_filename(file.filename)
-                unique = f"{prefix}_{int(datetime.now().timestamp())}_{filename}"
-                folder = Path('app/static/img')
-                folder.mkdir(parents=True, exist_ok=True)
-                file.save(str(folder / unique))
-                return f"/static/img/{unique}"
+                return store_uploaded_image(file, 'auracloud_slider', file_field)
         return url
 
-    before_image = _save_image('aura_before', 'before_image', 'before_image_url')
-    after_image = _save_image('aura_after', 'after_image', 'after_image_url')
+    before_image = _save_image('before_image', 'before_image_url')
+    after_image = _save_image('after_image', 'after_image_url')
     
     # Обновляем данные
     update_data = {
@@ -3,13 +3,11 @@
 """
 
 from flask import Blueprint, render_template, request, redirect, url_for, flash
-from werkzeug.utils import secure_filename
-from pathlib import Path
-from datetime import datetime
 import os
 from app.models.images import SectionBackgrounds
 from app.utils.logger import get_logger
 from app.utils.auth import require_admin_token
+from app.utils.image_pipeline import store_uploaded_image
 
 logger = get_logger()
 
@@ -89,20 +87,8 @@ def background_update(token, section):
     if 'image_file' in request.files:
         file = request.files['image_file']
         if file and file.filename and allowed_file(file.filename):
-            filename = secure_filename(file.filename)
-            # Создаём уникальное имя файла
-            timestamp = int(datetime.now().timestamp())
-            unique_filename = f"{section}_{timestamp}_{filename}"
-            
-            # Путь для сохранения
-            upload_folder = Path('app/static/img')
-            upload_folder.mkdir(parents=True, exist_ok=True)
-            
-            file_path = upload_folder / unique_filename
-            file.save(str(file_path))
-            
-            image_url = f"/static/img/{unique_filename}"
-            logger.info(f"Загружено изображение: {unique_filename}")
+            # Оригинал, уменьшенные и WebP-копии, запись в таблицу images
+            image_url = store_uploaded_image(file, section, 'background')
     
     if backgrounds.update_section_background(
         section, bg_type, image_url, gradient, overlay_opacity, overlay_color
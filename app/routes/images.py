@@ -0,0 +1,77 @@
+"""
+Маршрут уменьшенных по запросу изображений и заголовки кеширования загрузок.
+"""
+
+from flask import Blueprint, abort, current_app, redirect, request, send_file, url_for
+
+from app.utils.image_pipeline import is_content_addressed
+from app.utils.image_resize import resized_images
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+# Создание Blueprint для изображений
+images_bp = Blueprint('images', __name__)
+
+
+@images_bp.route('/img/<int:width>/<path:filename>')
+def resized(width: int, filename: str):
+    """
+    Картинка из static, уменьшенная до ширины width, в формате WebP.
+    Допустимы только ширины из IMAGE_VARIANT_WIDTHS, чтобы произвольными
+    ширинами нельзя было заполнить кеш.
+
+    Args:
+        width: Ширина
+        filename: Путь относительно static (img/hero.png)
+
+    Returns:
+        Файл WebP из дискового кеша или редирект на оригинал
+    """
+    if width not in current_app.config.get('IMAGE_VARIANT_WIDTHS', ()):
+        abort(404)
+    source = resized_images.source_path(filename)
+    if source is None:
+        abort(404)
+    if not resized_images.available:
+        return redirect(url_for('static', filename=filename))
+
+    try:
+        path = resized_images.get(source, width)
+    except Exception as exc:  # noqa: BLE001
+        logger.error(f"Ошибка уменьшения изображения {filename}: {exc}")
+        return redirect(url_for('static', filename=filename))
+
+    # mtime файла кеша - время последнего обращения (LRU), поэтому ETag и
+    # Last-Modified берутся от ключа кеша и исходника
+    response = send_file(
+        path,
+        mimetype='image/webp',
+        conditional=True,
+        etag=path.stem,
+        last_modified=source.stat().st_mtime,
+        max_age=current_app.config.get('IMAGE_CACHE_MAX_AGE', 31536000),
+    )
+    response.cache_control.public = True
+    # Ссылки из шаблонов содержат ?v=<mtime исходника>: при замене файла меняется URL
+    if request.args.get('v'):
+        response.cache_control.immutable = True
+    return response
+
+
+@images_bp.after_app_request
+def _cache_content_addressed(response):
+    """
+    Загрузки, сохранённые под хешем содержимого, никогда не меняются:
+    браузер и CDN кешируют их навсегда без повторной проверки.
+    """
+    if (
+        request.endpoint == 'static'
+        and response.status_code == 200
+        and is_content_addressed(request.view_args.get('filename', ''))
+    ):
+        response.cache_control.public = True
+        response.cache_control.no_cache = None
+        response.cache_control.max_age = current_app.config.get('IMAGE_CACHE_MAX_AGE', 31536000)
+        response.cache_control.immutable = True
+    return response
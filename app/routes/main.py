@@ -3,7 +3,7 @@
 Обрабатывает все запросы к главной странице и её секциям.
 """
 
-import json
+from urllib.parse import urlsplit, urlunsplit
 
 from flask import (
     Blueprint,
@@ -17,18 +17,133 @@ from flask import (
 )
 
 from app.database import ContentRepository
+from app.database.cache import image_cache, settings_cache
+from app.database.writer import write_queue
+from app.helpers import prefetch_content
 from app.i18n.const import DEFAULT_LANGUAGE, SUPPORTED_LANGUAGES
 from app.models.images import SectionBackgrounds
 from app.models.sections_visibility import SectionsVisibility
+from app.utils.fragment_cache import capture_section_versions, fragment_cache, render_section
+from app.utils.image_resize import resized_images
 from app.utils.logger import get_logger
+from app.utils.page_cache import cached_page, page_cache
+from app.utils.section_registry import SectionRegistry
 
 logger = get_logger()
 
 # Создание Blueprint для основных маршрутов
 main_bp = Blueprint("main", __name__)
 
+# Секции главной страницы (sections/<имя>.html) в порядке вывода
+# и секции контента, данные которых передаются в шаблон фрагмента
+landing_sections = SectionRegistry()
+
+
+def _add_background(sections: dict, name: str) -> None:
+    """Добавляет к данным секции фон из SectionBackgrounds."""
+    sections[name]["background"] = SectionBackgrounds.shared().get_section_background(name)
+
+
+@landing_sections.register("hero")
+def _prepare_hero(sections: dict) -> None:
+    """Фон секции Hero."""
+    _add_background(sections, "hero")
+
+
+@landing_sections.register("about")
+def _prepare_about(sections: dict) -> None:
+    """Фон секции «О компании»."""
+    _add_background(sections, "about")
+
+
+@landing_sections.register("products")
+def _prepare_products(sections: dict) -> None:
+    """Фон секции продукции."""
+    _add_background(sections, "products")
+
+
+# JSON-поля (features, products, services_list и т.д.) уже распарсены при чтении
+landing_sections.register("services")
+landing_sections.register("personalization", ("personalization", "auracloud_slider"))
+
+
+@landing_sections.register("reviews")
+def _prepare_reviews(sections: dict) -> None:
+    """Заголовок по умолчанию; отзывы пока выводятся статически."""
+    reviews_data = sections["reviews"]
+    if not reviews_data.get("title"):
+        reviews_data["title"] = "Отзывы наших клиентов"
+    reviews_data["reviews_list"] = []
+
+
+@landing_sections.register("blog")
+def _prepare_blog(sections: dict) -> None:
+    """Список статей блога для шаблона."""
+    blog_data = sections["blog"]
+    blog_data["articles_list"] = blog_data.get("articles", [])
+
+
+landing_sections.register("contacts")
+
+# Префикс языка в URL: /ru/, /lv/, /en/
+LOCALE_PREFIX = "/<any({}):lang_code>".format(", ".join(SUPPORTED_LANGUAGES))
+
+
+@main_bp.url_value_preprocessor
+def _pull_lang_code(endpoint, values):
+    """
+    Извлекает язык из префикса URL.
+    Такие страницы не зависят от сессии и могут кешироваться прокси и CDN.
+    """
+    if values and "lang_code" in values:
+        g.locale = values.pop("lang_code")
+        g.locale_from_path = True
+
+
+@main_bp.url_defaults
+def _add_lang_code(endpoint, values):
+    """Сохраняет префикс языка в ссылках, построенных на странице с префиксом."""
+    if "lang_code" in values or not g.get("locale_from_path"):
+        return
+    if current_app.url_map.is_endpoint_expecting(endpoint, "lang_code"):
+        values["lang_code"] = g.locale
+
+
+@main_bp.before_request
+def _redirect_to_locale_url():
+    """
+    В режиме LOCALE_URL_PREFIX перенаправляет страницы без префикса
+    на адрес с языком, определённым по ?lang= или сессии.
+    """
+    if not current_app.config.get("LOCALE_URL_PREFIX") or g.get("locale_from_path"):
+        return None
+    if request.endpoint and current_app.url_map.is_endpoint_expecting(request.endpoint, "lang_code"):
+        return redirect(url_for(request.endpoint, lang_code=g.locale))
+    return None
+
+
+def _switch_locale_in_url(url: str, lang: str) -> str:
+    """
+    Заменяет префикс языка в URL, если он есть.
+
+    Args:
+        url: Исходный URL
+        lang: Новый язык
+
+    Returns:
+        URL с новым префиксом языка или исходный URL
+    """
+    parts = urlsplit(url)
+    segments = parts.path.split("/")
+    if len(segments) > 1 and segments[1] in SUPPORTED_LANGUAGES:
+        segments[1] = lang
+        return urlunsplit(parts._replace(path="/".join(segments)))
+    return url
+
 
 @main_bp.route("/")
+@main_bp.route(LOCALE_PREFIX + "/")
+@cached_page
 def index():
     """
     Главная страница лендинга.
@@ -41,75 +156,35 @@ def index():
     locale = getattr(g, "locale", DEFAULT_LANGUAGE)
     logger.info("Запрос главной страницы, локаль: {}", locale)
 
-    backgrounds = SectionBackgrounds()
-    sections_visibility = SectionsVisibility()
+    sections_visibility = SectionsVisibility.shared().get_all_sections()
+    # Читаются, готовятся и рендерятся только видимые секции
+    visible = landing_sections.visible(sections_visibility)
+    # get_content в шаблонах заранее загружает только секции видимых фрагментов
+    prefetch_content(landing_sections.data_sections(visible))
 
-    # Получаем контент напрямую из БД на нужном языке
-    hero_data = ContentRepository.get_section("hero", locale)
-    hero_data["background"] = backgrounds.get_section_background("hero")
+    capture_section_versions()
+    # Контент видимых секций на нужном языке: из кеша или одной строкой page_documents
+    sections = ContentRepository.get_page("index", locale, landing_sections.data_sections(visible))
+    for section in visible:
+        if section.prepare is not None:
+            section.prepare(sections)
 
-    about_data = ContentRepository.get_section("about", locale)
-    about_data["background"] = backgrounds.get_section_background("about")
-    
-    # Парсим JSON для features (только если это строка)
-    if about_data.get('features') and isinstance(about_data['features'], str):
-        try:
-            about_data['features'] = json.loads(about_data['features'])
-        except json.JSONDecodeError:
-            about_data['features'] = []
-
-    products_data = ContentRepository.get_section("products", locale)
-    products_data["background"] = backgrounds.get_section_background("products")
-    # products - это уже распарсенный JSON из БД благодаря get_section()
-
-    services_data = ContentRepository.get_section("services", locale)
-    
-    # Парсим JSON для services_list (только если это строка)
-    if services_data.get('services_list') and isinstance(services_data['services_list'], str):
-        try:
-            services_data['services_list'] = json.loads(services_data['services_list'])
-        except json.JSONDecodeError:
-            services_data['services_list'] = []
-
-    personalization_data = ContentRepository.get_section("personalization", locale)
-    
-    # Парсим JSON для dna_testing и auracloud (только если это строки)
-    if personalization_data.get('dna_testing') and isinstance(personalization_data['dna_testing'], str):
-        try:
-            personalization_data['dna_testing'] = json.loads(personalization_data['dna_testing'])
-        except json.JSONDecodeError:
-            pass
-    
-    if personalization_data.get('auracloud') and isinstance(personalization_data['auracloud'], str):
-        try:
-            personalization_data['auracloud'] = json.loads(personalization_data['auracloud'])
-        except json.JSONDecodeError:
-            pass
-
-    reviews_data = ContentRepository.get_section("reviews", locale)
-    if not reviews_data.get("title"):
-        reviews_data["title"] = "Отзывы наших клиентов"
-    reviews_data["reviews_list"] = []
-
-    blog_data = ContentRepository.get_section("blog", locale)
-    blog_data["articles_list"] = blog_data.get("articles", [])
-
-    contacts_data = ContentRepository.get_section("contacts", locale)
-
-    slider_data = ContentRepository.get_section("auracloud_slider", locale)
+    # Каждая видимая секция рендерится отдельным фрагментом, который берётся
+    # из кеша, пока не изменились секции контента, прочитанные при его рендере
+    section_html = {
+        section.name: render_section(
+            section.name,
+            section.data_sections,
+            **{name: sections[name] for name in section.data_sections},
+        )
+        for section in visible
+    }
 
     return render_template(
         "index.html",
-        hero=hero_data,
-        about=about_data,
-        products=products_data,
-        services=services_data,
-        personalization=personalization_data,
-        reviews=reviews_data,
-        blog=blog_data,
-        contacts=contacts_data,
-        sections_visibility=sections_visibility.get_all_sections(),
-        auracloud_slider=slider_data,
+        section_html=section_html,
+        sections_visibility=sections_visibility,
+        **sections,
     )
 
 
@@ -130,10 +205,12 @@ def set_language(lang: str):
         return {"status": "success", "language": lang}, 200
 
     next_url = request.args.get("next") or request.referrer or url_for("main.index")
-    return redirect(next_url)
+    return redirect(_switch_locale_in_url(next_url, lang))
 
 
 @main_bp.route('/catalog')
+@main_bp.route(LOCALE_PREFIX + '/catalog')
+@cached_page
 def catalog():
     """
     Каталог продукции.
@@ -144,18 +221,11 @@ def catalog():
     logger.info("Запрос страницы каталога продукции")
     
     locale = getattr(g, "locale", DEFAULT_LANGUAGE)
-    backgrounds = SectionBackgrounds()
+    backgrounds = SectionBackgrounds.shared()
     
-    # Получаем продукты из БД
+    # Получаем продукты из БД (JSON уже распарсен репозиторием)
     products_data = ContentRepository.get_section("products", locale)
     
-    # Парсим JSON для products (только если это строка)
-    if products_data.get('products') and isinstance(products_data['products'], str):
-        try:
-            products_data['products'] = json.loads(products_data['products'])
-        except json.JSONDecodeError:
-            products_data['products'] = []
-    
     catalog_products = products_data.get('products', [])
     catalog_background = backgrounds.get_section_background('products')
     
@@ -177,6 +247,16 @@ def health_check():
     Returns:
         JSON с статусом приложения
     """
-    return {'status': 'healthy', 'service': 'OilFusion Landing'}, 200
+    return {
+        'status': 'healthy',
+        'service': 'OilFusion Landing',
+        'content_cache': ContentRepository.cache_stats(),
+        'page_cache': page_cache.stats(),
+        'fragment_cache': fragment_cache.stats(),
+        'write_queue': write_queue.stats(),
+        'settings_cache': settings_cache.stats(),
+        'image_cache': image_cache.stats(),
+        'resized_images': resized_images.stats(),
+    }, 200
 
 
@@ -626,8 +626,14 @@
                 })
                 .then(response => {
                     if (response.ok) {
-                        // Перезагружаем страницу для применения нового языка
-                        window.location.reload();
+                        // Переходим на версию страницы с новым языком, если она есть,
+                        // иначе перезагружаем страницу для применения нового языка
+                        const localeUrl = btn.getAttribute('data-url');
+                        if (localeUrl) {
+                            window.location.href = localeUrl;
+                        } else {
+                            window.location.reload();
+                        }
                     } else {
                         console.error('Ошибка при смене языка:', response.statusText);
                         // Возвращаем активный класс обратно при ошибке
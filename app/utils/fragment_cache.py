@@ -0,0 +1,160 @@
+"""
+Кеш отрендеренных фрагментов секций главной страницы (sections/*.html).
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Tuple
+
+from flask import g, render_template
+from markupsafe import Markup
+
+from app.database.cache import image_cache, section_cache
+from app.i18n.const import DEFAULT_LANGUAGE
+from app.models.images import SectionBackgrounds
+
+# (секция, locale, язык в префиксе URL)
+FragmentKey = Tuple[str, str, bool]
+
+
+@dataclass(frozen=True)
+class CachedFragment:
+    """Отрендеренный фрагмент и версии контента, из которого он собран."""
+
+    dependencies: Tuple[Tuple[str, int], ...]
+    assets_version: Hashable
+    html: Markup
+
+
+class FragmentCache:
+    """
+    Кеш HTML фрагментов секций по ключу (секция, locale, префикс языка).
+
+    Вместе с фрагментом хранятся версии всех секций контента, которые были
+    прочитаны при его рендере (данные самой секции и вызовы get_content).
+    Правка одной секции делает недействительными только фрагменты,
+    которые от неё зависят.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._fragments: Dict[FragmentKey, CachedFragment] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: FragmentKey, assets_version: Hashable) -> Optional[Markup]:
+        """
+        Получить фрагмент, если контент, из которого он собран, не менялся.
+
+        Args:
+            key: Ключ фрагмента
+            assets_version: Текущая версия изображений (assets_version())
+
+        Returns:
+            HTML фрагмента или None
+        """
+        fragment = self._fragments.get(key)
+        if (
+            fragment is not None
+            and fragment.assets_version == assets_version
+            and all(section_cache.section_version(name) == version for name, version in fragment.dependencies)
+        ):
+            self.hits += 1
+            return fragment.html
+        self.misses += 1
+        return None
+
+    def put(self, key: FragmentKey, fragment: CachedFragment) -> None:
+        """Сохранить фрагмент."""
+        with self._lock:
+            self._fragments[key] = fragment
+
+    def clear(self) -> None:
+        """Сбросить все фрагменты."""
+        with self._lock:
+            self._fragments.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Статистика кеша."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._fragments),
+        }
+
+
+# Глобальный инстанс кеша фрагментов.
+fragment_cache = FragmentCache()
+
+
+def track_content_dependency(section: str) -> None:
+    """
+    Отметить, что рендер текущего фрагмента читает секцию контента.
+    Вызывается хелперами get_content/get_section_content.
+
+    Args:
+        section: Секция контента
+    """
+    dependencies = g.get('_fragment_dependencies')
+    if dependencies is not None:
+        dependencies.add(section)
+
+
+def capture_section_versions() -> None:
+    """
+    Запомнить версии секций контента до чтения данных для фрагментов.
+    Вызывается маршрутом перед загрузкой секций: если секцию изменят
+    во время рендера, фрагмент сохранится со старой версией и не будет
+    считаться актуальным.
+    """
+    g._section_versions = section_cache.section_versions()
+
+
+def assets_version() -> Tuple[Hashable, int]:
+    """
+    Версия изображений во фрагментах: файл фонов секций и таблица images
+    (от неё зависят srcset и размеры картинок).
+    """
+    return (SectionBackgrounds.shared().version, image_cache.version)
+
+
+def render_section(name: str, data_sections: Tuple[str, ...], **context) -> Markup:
+    """
+    Отрендерить sections/<name>.html или взять готовый фрагмент из кеша.
+
+    Args:
+        name: Имя секции (имя шаблона в sections/)
+        data_sections: Секции контента, данные которых переданы в context
+        **context: Переменные шаблона секции
+
+    Returns:
+        HTML фрагмента
+    """
+    locale = getattr(g, 'locale', DEFAULT_LANGUAGE)
+    # Ссылки во фрагменте отличаются для адресов с префиксом языка и без него
+    key = (name, locale, bool(g.get('locale_from_path')))
+    # Версия снимается до рендера: если копии изменят во время рендера,
+    # фрагмент сохранится со старой версией и не будет считаться актуальным
+    version = assets_version()
+
+    html = fragment_cache.get(key, version)
+    if html is not None:
+        return html
+
+    if g.get('_section_versions') is None:
+        capture_section_versions()
+    base_version, versions = g._section_versions
+
+    dependencies = set(data_sections)
+    g._fragment_dependencies = dependencies
+    try:
+        html = Markup(render_template(f'sections/{name}.html', **context))
+    finally:
+        g._fragment_dependencies = None
+
+    fragment_cache.put(key, CachedFragment(
+        dependencies=tuple(sorted((section, versions.get(section, base_version)) for section in dependencies)),
+        assets_version=version,
+        html=html,
+    ))
+    return html
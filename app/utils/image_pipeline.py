@@ -0,0 +1,267 @@
+"""
+Обработка загруженных изображений.
+
+Файлы адресуются содержимым: оригинал сохраняется в static/img под именем
+<sha256 содержимого>.<расширение>, поэтому повторная загрузка той же картинки
+(в товары, услуги или фоны) не создаёт копию, а URL никогда не меняет
+содержимого и кешируется навсегда. Для каждой ширины из
+IMAGE_VARIANT_WIDTHS, меньшей ширины оригинала, создаётся WebP-копия
+<имя>-<ширина>w.webp; кроме того, создаётся WebP в исходном размере.
+Оригинал и варианты записываются в таблицу images (варианты - с parent_id
+оригинала) одной транзакцией через очередь записи.
+
+Без Pillow варианты не создаются и записывается только оригинал.
+"""
+
+import mimetypes
+import os
+import re
+import tempfile
+from dataclasses import asdict, dataclass
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from flask import current_app
+from werkzeug.datastructures import FileStorage
+from werkzeug.utils import secure_filename
+
+from app.database.repositories import ImageRepository
+from app.database.writer import write_queue
+from app.utils.logger import get_logger
+
+try:
+    from PIL import Image as PILImage
+    from PIL import ImageOps
+except ImportError:  # Pillow не установлен: сохраняется только оригинал
+    PILImage = None
+    ImageOps = None
+
+logger = get_logger()
+
+# Сколько ждать записи в БД через очередь, секунд
+RECORD_TIMEOUT = 30
+
+# Размер блока при потоковой записи загрузки на диск
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Длина имени файла из хеша (128 бит)
+HASH_NAME_LENGTH = 32
+
+# Имена файлов, адресуемых содержимым: оригинал и его варианты
+_CONTENT_ADDRESSED_NAME = re.compile(rf'^[0-9a-f]{{{HASH_NAME_LENGTH}}}(-\d+w)?\.[a-z]+$')
+
+
+@dataclass(frozen=True)
+class ImageFile:
+    """Файл изображения в static/img с размерами для записи в images."""
+
+    filename: str
+    url: str
+    size_bytes: int
+    mime_type: Optional[str]
+    width: Optional[int]
+    height: Optional[int]
+
+
+def upload_folder() -> Path:
+    """Папка загруженных изображений (static/img приложения)."""
+    folder = Path(current_app.static_folder) / 'img'
+    folder.mkdir(parents=True, exist_ok=True)
+    return folder
+
+
+def is_content_addressed(filename: str) -> bool:
+    """
+    Адресуется ли файл содержимым (содержимое по этому имени не меняется).
+
+    Args:
+        filename: Имя файла или путь (img/<хеш>.png)
+
+    Returns:
+        True для загрузок, сохранённых под хешем, и их вариантов
+    """
+    return bool(_CONTENT_ADDRESSED_NAME.match(filename.rsplit('/', 1)[-1]))
+
+
+def _temporary_path(folder: Path) -> Path:
+    """Уникальный временный файл в папке (скрытый, статический экспорт его пропускает)."""
+    fd, name = tempfile.mkstemp(dir=folder, prefix='.upload-', suffix='.tmp')
+    os.close(fd)
+    return Path(name)
+
+
+def _describe(path: Path, width: Optional[int] = None, height: Optional[int] = None) -> ImageFile:
+    return ImageFile(
+        filename=path.name,
+        url=f"/static/img/{path.name}",
+        size_bytes=path.stat().st_size,
+        mime_type=mimetypes.guess_type(path.name)[0],
+        width=width,
+        height=height,
+    )
+
+
+def normalize_image(source: "PILImage.Image") -> "PILImage.Image":
+    """
+    Подготовить изображение к сохранению в WebP: ориентация из EXIF
+    (фото с телефона) и режим RGB/RGBA.
+
+    Args:
+        source: Открытое изображение Pillow
+
+    Returns:
+        Изображение в режиме RGB или RGBA
+    """
+    image = ImageOps.exif_transpose(source)
+    if image.mode not in ('RGB', 'RGBA'):
+        has_alpha = 'A' in image.mode or 'transparency' in image.info
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+    return image
+
+
+def create_variants(path: Path, widths: Iterable[int], quality: int = 80) -> List[ImageFile]:
+    """
+    Создать WebP-варианты изображения рядом с оригиналом.
+
+    Args:
+        path: Путь к оригиналу
+        widths: Ширины уменьшенных копий (большие или равные ширине оригинала пропускаются)
+        quality: Качество WebP
+
+    Returns:
+        Описание оригинала (с размерами) и созданных вариантов; без Pillow,
+        для SVG, анимаций и нераспознанных файлов - только оригинал
+    """
+    if PILImage is None or path.suffix.lower() == '.svg':
+        return [_describe(path)]
+
+    try:
+        with PILImage.open(path) as source:
+            if getattr(source, 'is_animated', False):
+                # Анимацию не пережимаем: у копий остался бы только первый кадр
+                return [_describe(path, *source.size)]
+            image = normalize_image(source)
+            width, height = image.size
+
+            files = [_describe(path, width, height)]
+            targets = [(w, round(height * w / width)) for w in sorted(set(widths)) if w < width]
+            if path.suffix.lower() != '.webp':
+                targets.append((width, height))
+            for target_width, target_height in targets:
+                suffix = '' if target_width == width else f'-{target_width}w'
+                variant_path = path.with_name(f'{path.stem}{suffix}.webp')
+                variant = image if target_width == width else image.resize(
+                    (target_width, target_height), PILImage.Resampling.LANCZOS
+                )
+                # Запись через временный файл: при параллельной загрузке той же
+                # картинки читатели не увидят недописанный вариант
+                tmp_path = _temporary_path(path.parent)
+                try:
+                    variant.save(tmp_path, 'WEBP', quality=quality, method=6)
+                    os.replace(tmp_path, variant_path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+                files.append(_describe(variant_path, target_width, target_height))
+    except Exception as exc:  # noqa: BLE001
+        # Файл с допустимым расширением, но не читаемый Pillow, сохраняется как есть
+        logger.warning(f"Не удалось обработать изображение {path.name}: {exc}")
+        return [_describe(path)]
+
+    return files
+
+
+def _record_images(original: Dict[str, Any], variants: List[Dict[str, Any]]) -> int:
+    """Записать оригинал и варианты в images (выполняется в очереди записи)."""
+    existing = ImageRepository.get_by_filename(original['filename'])
+    if existing is not None:
+        # Те же байты уже загружены (возможно, другим воркером): запись есть
+        return existing.id
+    image = ImageRepository.create(**original)
+    for variant in variants:
+        ImageRepository.create(parent_id=image.id, **variant)
+    return image.id
+
+
+def _save_stream(file: FileStorage, folder: Path) -> Tuple[Path, str]:
+    """
+    Записать загрузку во временный файл, считая sha256 по ходу записи.
+
+    Args:
+        file: Объект FileStorage из Flask
+        folder: Папка назначения (временный файл создаётся в ней же для os.replace)
+
+    Returns:
+        (путь к временному файлу, hex-дайджест содержимого)
+    """
+    digest = sha256()
+    tmp_path = _temporary_path(folder)
+    try:
+        with open(tmp_path, 'wb') as target:
+            for chunk in iter(lambda: file.stream.read(UPLOAD_CHUNK_SIZE), b''):
+                digest.update(chunk)
+                target.write(chunk)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path, digest.hexdigest()
+
+
+def store_uploaded_image(file: FileStorage, section: str, field: str) -> str:
+    """
+    Сохранить загруженное изображение под хешем содержимого, создать
+    варианты и записать их в images. Если те же байты уже загружены,
+    возвращается URL существующего файла.
+    Расширение файла должно быть проверено вызывающим кодом.
+
+    Args:
+        file: Объект FileStorage из Flask
+        section: Секция (hero, about, products и т.д.)
+        field: Поле (background, image, icon и т.д.)
+
+    Returns:
+        URL оригинала (/static/img/<хеш>.<расширение>)
+    """
+    original_filename = secure_filename(file.filename)
+    # Расширение берётся из исходного имени: secure_filename выбрасывает
+    # кириллицу вместе с точкой ('фото.png' -> 'png')
+    extension = Path(file.filename).suffix.lower()
+    folder = upload_folder()
+    tmp_path, digest = _save_stream(file, folder)
+    target_path = folder / f"{digest[:HASH_NAME_LENGTH]}{extension}"
+    url = f"/static/img/{target_path.name}"
+
+    if target_path.exists():
+        tmp_path.unlink()
+        if ImageRepository.get_by_filename(target_path.name) is not None:
+            logger.info(f"Изображение {original_filename} уже загружено: {target_path.name}")
+            return url
+    else:
+        # Переименование атомарно: по URL никогда не отдаётся недописанный файл
+        os.replace(tmp_path, target_path)
+        logger.info(f"Изображение сохранено: {target_path.name} ({original_filename})")
+
+    config = current_app.config
+    original, *variants = create_variants(
+        target_path,
+        config.get('IMAGE_VARIANT_WIDTHS', ()),
+        config.get('IMAGE_WEBP_QUALITY', 80),
+    )
+    if variants:
+        logger.info(
+            f"Создано вариантов {target_path.name}: "
+            + ", ".join(f"{item.width}w {item.size_bytes} байт" for item in variants)
+        )
+
+    record = {'original_filename': original_filename, 'section': section, 'field': field}
+    try:
+        write_queue.submit(
+            _record_images,
+            {**asdict(original), **record},
+            [{**asdict(variant), **record} for variant in variants],
+        ).result(timeout=RECORD_TIMEOUT)
+    except Exception as exc:  # noqa: BLE001
+        # Файлы уже сохранены: страница покажет оригинал и без записи в images
+        logger.error(f"Не удалось записать изображение {target_path.name} в БД: {exc}")
+
+    return url
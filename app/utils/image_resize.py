@@ -0,0 +1,274 @@
+"""
+Уменьшение изображений по запросу (/img/<ширина>/<путь в static>).
+
+Для старых картинок в static/img и URL, вставленных в админке вручную,
+копий в таблице images нет. Такие картинки уменьшаются при первом
+запросе и сохраняются в дисковый кеш data/image_cache, общий для воркеров.
+Размер кеша ограничен: при переполнении удаляются давно не запрашивавшиеся
+файлы (время последнего обращения хранится в mtime файла). Пока один
+запрос уменьшает картинку, остальные запросы того же варианта ждут
+блокировку и получают готовый файл.
+"""
+
+import os
+import threading
+import time
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from flask import current_app, url_for
+
+from app.database.repositories import ImageSet
+from app.utils.file_lock import file_lock
+from app.utils.image_pipeline import PILImage, normalize_image
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+# Форматы, которые уменьшаются (SVG и анимированный GIF отдаются как есть)
+RESIZABLE_SUFFIXES = {'.png', '.jpg', '.jpeg', '.webp'}
+
+# Количество файлов блокировок: варианты распределяются по ним по первому символу ключа
+_LOCK_STRIPES = 16
+
+# Как часто пересчитывать размер кеша на диске, пока создаются новые копии, секунд:
+# копии пишут и другие воркеры, а их размер в оценку этого процесса не попадает
+_SWEEP_INTERVAL = 60
+
+
+class ResizedImageCache:
+    """Дисковый кеш уменьшенных изображений с вытеснением по LRU."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._dir: Optional[Path] = None
+        self._max_bytes = 0
+        self._quality = 80
+        # Размеры исходников по (путь, mtime): заголовок файла читается один раз
+        self._dimensions: Dict[Tuple[Path, int], Tuple[int, int]] = {}
+        # Оценка размера кеша: точная после обхода папки, дальше + размер новых копий.
+        # None - папку ещё не обходили
+        self._size: Optional[int] = None
+        self._swept_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.sweeps = 0
+
+    def init_app(self, cache_dir: Path, max_bytes: int, quality: int = 80) -> None:
+        """
+        Настройка кеша.
+
+        Args:
+            cache_dir: Папка кеша
+            max_bytes: Максимальный размер кеша в байтах
+            quality: Качество WebP
+        """
+        self._dir = Path(cache_dir)
+        self._max_bytes = max_bytes
+        self._quality = quality
+        (self._dir / 'locks').mkdir(parents=True, exist_ok=True)
+
+    @property
+    def available(self) -> bool:
+        """Можно ли уменьшать изображения (настроен кеш и установлен Pillow)."""
+        return self._dir is not None and PILImage is not None
+
+    @staticmethod
+    def source_path(filename: str) -> Optional[Path]:
+        """
+        Путь к исходнику в папке static.
+
+        Args:
+            filename: Путь относительно static (img/hero.png)
+
+        Returns:
+            Путь к файлу или None, если файла нет, он вне static или не уменьшается
+        """
+        static_folder = Path(current_app.static_folder).resolve()
+        path = (static_folder / filename).resolve()
+        if static_folder not in path.parents or path.suffix.lower() not in RESIZABLE_SUFFIXES:
+            return None
+        return path if path.is_file() else None
+
+    def dimensions(self, source: Path) -> Optional[Tuple[int, int]]:
+        """
+        Размеры исходника (читается только заголовок файла, результат кешируется).
+
+        Args:
+            source: Путь к исходнику
+
+        Returns:
+            (ширина, высота) или None, если файл не читается
+        """
+        if PILImage is None:
+            return None
+        key = (source, source.stat().st_mtime_ns)
+        size = self._dimensions.get(key)
+        if size is None:
+            try:
+                with PILImage.open(source) as image:
+                    if getattr(image, 'is_animated', False):
+                        return None
+                    size = image.size
+                    # Ориентации 5-8 из EXIF поворачивают снимок на 90°
+                    if image.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+                        size = (size[1], size[0])
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(f"Не удалось прочитать размеры {source.name}: {exc}")
+                return None
+            with self._lock:
+                self._dimensions[key] = size
+        return size
+
+    def get(self, source: Path, width: int) -> Path:
+        """
+        Уменьшенная копия исходника: из кеша или созданная сейчас.
+
+        Args:
+            source: Путь к исходнику
+            width: Ширина копии (не больше ширины исходника)
+
+        Returns:
+            Путь к файлу WebP в кеше
+        """
+        stat = source.stat()
+        key = sha256(f'{source}:{stat.st_mtime_ns}:{stat.st_size}:{width}:{self._quality}'.encode()).hexdigest()
+        target = self._dir / key[:2] / f'{key}.webp'
+
+        if self._touch(target):
+            self.hits += 1
+            return target
+
+        # Блокировка и для потоков, и для воркеров: flock привязан к открытому файлу
+        with file_lock(self._dir / 'locks' / f'{int(key[0], 16) % _LOCK_STRIPES}.lock'):
+            if self._touch(target):
+                # Копию успел создать запрос, который держал блокировку
+                self.hits += 1
+                return target
+            self.misses += 1
+            started = time.perf_counter()
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_name(f'.{target.name}.tmp')
+            try:
+                with PILImage.open(source) as image:
+                    resized = normalize_image(image)
+                    if resized.width > width:
+                        height = round(resized.height * width / resized.width)
+                        resized = resized.resize((width, height), PILImage.Resampling.LANCZOS)
+                    resized.save(tmp_path, 'WEBP', quality=self._quality, method=6)
+                os.replace(tmp_path, target)
+            finally:
+                # Недописанный файл не считается _evict и иначе остался бы навсегда
+                tmp_path.unlink(missing_ok=True)
+            size = target.stat().st_size
+            logger.info(
+                "Уменьшено {} до {}w: {} байт, {:.0f} мс",
+                source.name, width, size, (time.perf_counter() - started) * 1000,
+            )
+
+        with self._lock:
+            if self._size is not None:
+                self._size += size
+            due = (
+                self._size is None
+                or self._size > self._max_bytes
+                or time.monotonic() - self._swept_at > _SWEEP_INTERVAL
+            )
+        # Обход папки - только при превышении оценки размера или раз в интервал,
+        # а не на каждый промах: иначе его цена росла бы с размером кеша
+        if due:
+            self._evict(keep=target)
+        return target
+
+    @staticmethod
+    def _touch(path: Path) -> bool:
+        """Отметить обращение к файлу кеша (mtime), если он есть."""
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _evict(self, keep: Path) -> None:
+        """
+        Обойти папку кеша, уточнить его размер и удалить давно не запрашивавшиеся
+        файлы, если кеш больше допустимого.
+
+        Args:
+            keep: Файл, который сейчас будет отдан (не удаляется)
+        """
+        with file_lock(self._dir / 'locks' / 'evict.lock'):
+            files = []
+            total = 0
+            for path in self._dir.glob('*/*.webp'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+            self.sweeps += 1
+
+            if total > self._max_bytes:
+                # Освобождаем с запасом, чтобы не чистить кеш после каждой новой копии
+                limit = self._max_bytes * 0.9
+                for _, size, path in sorted(files):
+                    if total <= limit:
+                        break
+                    if path == keep:
+                        continue
+                    path.unlink(missing_ok=True)
+                    total -= size
+                    self.evictions += 1
+                logger.info(f"Кеш уменьшенных изображений очищен до {total} байт")
+
+        with self._lock:
+            self._size = total
+            self._swept_at = time.monotonic()
+
+    def image_set(self, url: str) -> Optional[ImageSet]:
+        """
+        Копии картинки из static через /img/<ширина>/ для srcset и фонов,
+        если в таблице images их нет.
+
+        Args:
+            url: URL картинки (/static/...)
+
+        Returns:
+            ImageSet или None, если картинка не из static или не уменьшается
+        """
+        static_prefix = current_app.static_url_path.rstrip('/') + '/'
+        if not self.available or not url or not url.startswith(static_prefix):
+            return None
+        filename = url[len(static_prefix):].split('?', 1)[0]
+        source = self.source_path(filename)
+        if source is None:
+            return None
+        size = self.dimensions(source)
+        if size is None:
+            return None
+
+        width, height = size
+        version = source.stat().st_mtime_ns
+        candidates = [
+            (url_for('images.resized', width=target_width, filename=filename, v=version), target_width)
+            for target_width in sorted(set(current_app.config.get('IMAGE_VARIANT_WIDTHS', ())))
+            if target_width < width
+        ]
+        candidates.append((url, width))
+        return ImageSet(url=url, width=width, height=height, candidates=tuple(candidates))
+
+    def stats(self) -> Dict[str, int]:
+        """Статистика кеша."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'sweeps': self.sweeps,
+        }
+
+
+# Глобальный инстанс кеша уменьшенных изображений.
+resized_images = ResizedImageCache()
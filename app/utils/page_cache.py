@@ -0,0 +1,131 @@
+"""
+Кеш отрендеренных публичных страниц с поддержкой ETag/304.
+"""
+
+import threading
+from dataclasses import dataclass
+from functools import wraps
+from hashlib import sha256
+from typing import Dict, Hashable, Optional, Tuple
+
+from flask import current_app, g, make_response, request
+
+from app.database.cache import image_cache, section_cache
+from app.i18n.const import DEFAULT_LANGUAGE
+from app.models.images import SectionBackgrounds
+from app.models.sections_visibility import SectionsVisibility
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """Отрендеренная страница."""
+
+    version: Hashable
+    etag: str
+    body: str
+
+
+class PageCache:
+    """
+    Кеш HTML страниц по ключу (правило URL, locale).
+    Для каждого ключа хранится одна страница с версией контента, при которой
+    она была отрендерена; устаревшая версия просто перезаписывается.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pages: Dict[Tuple[str, str], CachedPage] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, rule: str, locale: str, version: Hashable) -> Optional[CachedPage]:
+        """Получить страницу, если она отрендерена для текущей версии контента."""
+        page = self._pages.get((rule, locale))
+        if page is not None and page.version == version:
+            self.hits += 1
+            return page
+        self.misses += 1
+        return None
+
+    def put(self, rule: str, locale: str, version: Hashable, body: str) -> CachedPage:
+        """Сохранить отрендеренную страницу и вычислить её ETag."""
+        page = CachedPage(
+            version=version,
+            etag=sha256(body.encode('utf-8')).hexdigest()[:32],
+            body=body,
+        )
+        with self._lock:
+            self._pages[(rule, locale)] = page
+        return page
+
+    def clear(self) -> None:
+        """Сбросить все страницы."""
+        with self._lock:
+            self._pages.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Статистика кеша."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._pages),
+        }
+
+
+# Глобальный инстанс кеша страниц.
+page_cache = PageCache()
+
+
+def content_version() -> Tuple:
+    """
+    Версия всего, из чего собираются публичные страницы:
+    контент и копии изображений (srcset) в БД и JSON-файлы фонов и видимости секций.
+    """
+    return (
+        section_cache.version,
+        image_cache.version,
+        SectionBackgrounds.shared().version,
+        SectionsVisibility.shared().version,
+    )
+
+
+def cached_page(view):
+    """
+    Декоратор для публичных страниц.
+    Отдаёт HTML из кеша, пока не изменился контент, и проставляет строгий ETag.
+    На If-None-Match с совпадающим ETag отвечает 304 без тела.
+    Страницы с языком в префиксе URL помечаются как public для прокси и CDN.
+
+    Usage:
+        @main_bp.route('/')
+        @cached_page
+        def index():
+            return render_template('index.html')
+    """
+    @wraps(view)
+    def decorated_function(*args, **kwargs):
+        locale = getattr(g, 'locale', DEFAULT_LANGUAGE)
+        version = content_version()
+        # Страница с префиксом языка и без него отличается ссылками
+        rule = request.url_rule.rule
+
+        page = page_cache.get(rule, locale, version)
+        if page is None:
+            body = view(*args, **kwargs)
+            if not isinstance(body, str):
+                return body
+            page = page_cache.put(rule, locale, version, body)
+
+        response = make_response(page.body)
+        response.set_etag(page.etag)
+        if g.get('locale_from_path'):
+            response.cache_control.public = True
+        max_age = current_app.config.get('PAGE_CACHE_MAX_AGE', 0)
+        if max_age and g.get('locale_from_path'):
+            response.cache_control.max_age = max_age
+        else:
+            # Браузер хранит страницу, но перепроверяет её по ETag при каждом заходе
+            response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+    return decorated_function
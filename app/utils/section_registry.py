@@ -0,0 +1,73 @@
+"""
+Реестр секций страницы: порядок вывода, секции контента и подготовка данных.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Подготовка данных секции перед рендером: дополняет словари секций контента на месте
+Preparer = Callable[[Dict[str, Dict[str, Any]]], None]
+
+
+@dataclass(frozen=True)
+class RegisteredSection:
+    """Секция страницы (фрагмент sections/<name>.html)."""
+
+    name: str
+    data_sections: Tuple[str, ...]
+    prepare: Optional[Preparer] = None
+
+
+class SectionRegistry:
+    """
+    Секции страницы в порядке регистрации.
+
+    Маршрут сначала выбирает видимые секции, а затем читает, готовит
+    и рендерит только их: скрытая секция не стоит ни запроса к БД,
+    ни разбора JSON, ни рендера шаблона.
+    """
+
+    def __init__(self) -> None:
+        self._sections: Dict[str, RegisteredSection] = {}
+
+    def register(self, name: str, data_sections: Optional[Iterable[str]] = None) -> Callable[[Preparer], Preparer]:
+        """
+        Зарегистрировать секцию. Результат можно использовать как декоратор
+        функции подготовки данных секции.
+
+        Args:
+            name: Имя секции (шаблон sections/<name>.html и ключ видимости)
+            data_sections: Секции контента, которые нужны шаблону (по умолчанию сама секция)
+
+        Returns:
+            Декоратор, задающий функцию подготовки данных
+
+        Usage:
+            @landing_sections.register("hero")
+            def _prepare_hero(sections):
+                sections["hero"]["background"] = ...
+        """
+        self._sections[name] = RegisteredSection(name, tuple(data_sections or (name,)))
+
+        def decorator(prepare: Preparer) -> Preparer:
+            self._sections[name] = replace(self._sections[name], prepare=prepare)
+            return prepare
+
+        return decorator
+
+    def visible(self, visibility: Mapping[str, bool]) -> List[RegisteredSection]:
+        """
+        Видимые секции в порядке вывода.
+
+        Args:
+            visibility: Словарь видимости секций (SectionsVisibility)
+
+        Returns:
+            Список видимых секций
+        """
+        return [section for section in self._sections.values() if visibility.get(section.name)]
+
+    @staticmethod
+    def data_sections(sections: Iterable[RegisteredSection]) -> Tuple[str, ...]:
+        """Секции контента, нужные переданным секциям страницы, без повторов."""
+        return tuple(dict.fromkeys(name for section in sections for name in section.data_sections))
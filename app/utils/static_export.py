@@ -0,0 +1,212 @@
+"""
+Статический экспорт публичных страниц.
+Рендерит / и /catalog для всех языков в папку, которую может раздавать nginx,
+вместе со статикой и уменьшенными копиями картинок (/img/<ширина>/...),
+на которые ссылаются страницы.
+"""
+
+import os
+import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+from pathlib import Path
+from typing import Iterable, List, Set, Tuple
+from urllib.parse import unquote
+
+from flask import Flask
+
+from app.i18n.const import SUPPORTED_LANGUAGES
+from app.utils.image_resize import resized_images
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+# Ссылки на копии, уменьшаемые по запросу: /img/<ширина>/<путь в static>
+_RESIZED_URL = re.compile(rb'/img/(\d+)/([^"\'\s?,)]+)')
+
+# Состояние фонового экспорта после сохранений в админке
+_background_lock = threading.Lock()
+_background_state = {'running': False, 'pending': False}
+
+
+@dataclass
+class ExportResult:
+    """Результат экспорта."""
+
+    written: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    assets_copied: int = 0
+    images_written: int = 0
+
+
+def export_pages() -> List[Tuple[str, str]]:
+    """
+    Список экспортируемых страниц.
+
+    Returns:
+        Список пар (URL, путь файла относительно папки экспорта)
+    """
+    pages = [('/', 'index.html'), ('/catalog', 'catalog/index.html')]
+    for lang in SUPPORTED_LANGUAGES:
+        pages.append((f'/{lang}/', f'{lang}/index.html'))
+        pages.append((f'/{lang}/catalog', f'{lang}/catalog/index.html'))
+    return pages
+
+
+def _render(app: Flask, url: str, base_url: str) -> Tuple[int, bytes]:
+    """Рендер страницы через тестовый клиент без cookie."""
+    client = app.test_client(use_cookies=False)
+    response = client.get(url, base_url=base_url)
+    return response.status_code, response.get_data()
+
+
+def _write_if_changed(target: Path, body: bytes) -> bool:
+    """
+    Атомарно записывает файл, если его содержимое изменилось.
+
+    Returns:
+        True если файл был записан
+    """
+    if target.exists() and target.read_bytes() == body:
+        return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f'.{target.name}.tmp')
+    tmp_path.write_bytes(body)
+    os.replace(tmp_path, target)
+    return True
+
+
+def _sync_assets(source: Path, target: Path) -> int:
+    """
+    Копирует статику, пропуская файлы с тем же размером и mtime и скрытые файлы.
+
+    Returns:
+        Количество скопированных файлов
+    """
+    copied = 0
+    for path in source.rglob('*'):
+        if not path.is_file() or path.name.startswith('.'):
+            # Скрытые файлы - временные файлы загрузок, которые ещё пишутся
+            continue
+        destination = target / path.relative_to(source)
+        src_stat = path.stat()
+        if destination.exists():
+            dst_stat = destination.stat()
+            if dst_stat.st_size == src_stat.st_size and int(dst_stat.st_mtime) == int(src_stat.st_mtime):
+                continue
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(path, destination)
+        copied += 1
+    return copied
+
+
+def _export_resized_images(app: Flask, bodies: Iterable[bytes], output_dir: Path) -> int:
+    """
+    Записывает в экспорт уменьшенные копии, на которые ссылаются страницы,
+    по тем же путям /img/<ширина>/<файл>, что и у маршрута images.resized.
+
+    Returns:
+        Количество записанных файлов
+    """
+    variants: Set[Tuple[int, str]] = set()
+    for body in bodies:
+        for width, filename in _RESIZED_URL.findall(body):
+            variants.add((int(width), unquote(filename.decode())))
+
+    written = 0
+    with app.app_context():
+        for width, filename in sorted(variants):
+            source = resized_images.source_path(filename)
+            if source is None or not resized_images.available:
+                continue
+            path = resized_images.get(source, width)
+            if _write_if_changed(output_dir / 'img' / str(width) / filename, path.read_bytes()):
+                written += 1
+    return written
+
+
+def export_site(app: Flask, output_dir: Path, workers: int = 1) -> ExportResult:
+    """
+    Экспорт всех публичных страниц и статики.
+    Повторный запуск инкрементальный: перезаписываются только изменившиеся файлы.
+
+    Args:
+        app: Экземпляр Flask приложения
+        output_dir: Папка экспорта
+        workers: Количество потоков рендеринга
+
+    Returns:
+        ExportResult: Списки записанных, неизменившихся и пропущенных страниц
+    """
+    output_dir = Path(output_dir)
+    base_url = app.config.get('STATIC_EXPORT_BASE_URL', 'http://localhost')
+    pages = export_pages()
+    urls = [url for url, _ in pages]
+
+    # Страниц около десятка: рендер в потоках этого же приложения, без
+    # отдельных процессов с повторным запуском create_app и миграций
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='static-export') as pool:
+            rendered = list(pool.map(_render, repeat(app), urls, repeat(base_url)))
+    else:
+        rendered = [_render(app, url, base_url) for url in urls]
+
+    result = ExportResult()
+    for (url, relative_path), (status, body) in zip(pages, rendered):
+        if status != 200:
+            # Например, редирект на адрес с префиксом языка в режиме LOCALE_URL_PREFIX
+            result.skipped.append(url)
+            continue
+        if _write_if_changed(output_dir / relative_path, body):
+            result.written.append(url)
+        else:
+            result.unchanged.append(url)
+
+    result.assets_copied = _sync_assets(Path(app.static_folder), output_dir / 'static')
+    # nginx раздаёт экспорт без приложения, поэтому копии /img/... нужны в виде файлов
+    result.images_written = _export_resized_images(
+        app, (body for status, body in rendered if status == 200), output_dir,
+    )
+    logger.info(
+        "Статический экспорт в {}: записано {}, без изменений {}, пропущено {}, файлов статики {}, копий картинок {}",
+        output_dir, len(result.written), len(result.unchanged), len(result.skipped),
+        result.assets_copied, result.images_written,
+    )
+    return result
+
+
+def schedule_export(app: Flask) -> None:
+    """
+    Запускает инкрементальный экспорт в фоновом потоке.
+    Вызовы во время идущего экспорта объединяются в один повторный прогон.
+
+    Args:
+        app: Экземпляр Flask приложения
+    """
+    output_dir = app.config.get('STATIC_EXPORT_DIR')
+    if not output_dir:
+        return
+
+    with _background_lock:
+        if _background_state['running']:
+            _background_state['pending'] = True
+            return
+        _background_state['running'] = True
+
+    def _run() -> None:
+        while True:
+            try:
+                export_site(app, Path(output_dir))
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Ошибка фонового статического экспорта: {}", exc)
+            with _background_lock:
+                if not _background_state['pending']:
+                    _background_state['running'] = False
+                    return
+                _background_state['pending'] = False
+
+    threading.Thread(target=_run, name='static-export', daemon=True).start()
@@ -0,0 +1,170 @@
+"""
+Бенчмарк чтения контента из SQLite во время параллельной записи.
+Сравнивает профиль по умолчанию (rollback journal) с профилем из настроек (WAL и т.д.).
+
+Запуск:
+    python benchmark_sqlite.py --readers 8 --seconds 5
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, event, select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
+
+# Добавляем путь к приложению
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.config.settings import Config
+from app.database.connection import apply_sqlite_profile, sqlite_profile
+from app.database.models import Content
+
+SECTIONS = ('hero', 'about', 'products', 'services', 'personalization', 'reviews', 'blog', 'contacts')
+KEYS_PER_SECTION = 25
+
+# Поведение SQLite до профиля: rollback journal, без mmap, кеш по умолчанию
+DEFAULT_PROFILE = {
+    'journal_mode': 'DELETE',
+    'synchronous': 'FULL',
+    'mmap_size': 0,
+    'cache_size': -2000,
+    'busy_timeout': 5000,
+}
+
+
+def make_engine(db_path: Path, profile: dict, pool_size: int):
+    """Движок с пулом и обработчиком connect, как в init_db."""
+    engine = create_engine(
+        f'sqlite:///{db_path}',
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=pool_size,
+    )
+    event.listen(engine, 'connect', lambda conn, _record: apply_sqlite_profile(conn, profile))
+    return engine
+
+
+def seed(engine) -> None:
+    """Создание таблицы content и тестовых строк."""
+    table = Content.__table__
+    table.metadata.create_all(engine, tables=[table])
+    rows = [
+        {
+            'section': section,
+            'key': f'key_{index}',
+            'value_ru': f'{section} {index} ' * 10,
+            'value_lv': f'{section} {index} lv ' * 10,
+            'value_en': None,
+            'data_type': 'text',
+        }
+        for section in SECTIONS
+        for index in range(KEYS_PER_SECTION)
+    ]
+    with engine.begin() as conn:
+        conn.execute(table.insert(), rows)
+
+
+def run(profile_name: str, profile: dict, readers: int, seconds: float) -> dict:
+    """Чтение секций в `readers` потоках при постоянной записи в одном потоке."""
+    table = Content.__table__
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(Path(tmp) / 'bench.db', profile, pool_size=readers + 1)
+        seed(engine)
+
+        stop = threading.Event()
+        counters = {'reads': 0, 'writes': 0, 'read_errors': 0, 'write_errors': 0}
+        latencies = []
+        lock = threading.Lock()
+        read_query = (
+            select(table.c.id, table.c.section, table.c.key, table.c.value_lv, table.c.value_ru)
+            .where(table.c.section.in_(SECTIONS))
+        )
+
+        def reader() -> None:
+            reads = errors = 0
+            local_latencies = []
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    with engine.connect() as conn:
+                        conn.execute(read_query).fetchall()
+                    reads += 1
+                    local_latencies.append(time.perf_counter() - started)
+                except OperationalError:
+                    errors += 1
+            with lock:
+                latencies.extend(local_latencies)
+                counters['reads'] += reads
+                counters['read_errors'] += errors
+
+        def writer() -> None:
+            writes = errors = 0
+            while not stop.is_set():
+                try:
+                    with engine.begin() as conn:
+                        conn.execute(
+                            update(table)
+                            .where(table.c.section == SECTIONS[writes % len(SECTIONS)])
+                            .values(value_ru=f'edit {writes}')
+                        )
+                    writes += 1
+                except OperationalError:
+                    errors += 1
+            with lock:
+                counters['writes'] += writes
+                counters['write_errors'] += errors
+
+        threads = [threading.Thread(target=reader) for _ in range(readers)]
+        threads.append(threading.Thread(target=writer))
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        engine.dispose()
+
+    latencies.sort()
+    return {
+        'profile': profile_name,
+        'read_p99_ms': latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0,
+        'reads_per_sec': counters['reads'] / seconds,
+        'writes_per_sec': counters['writes'] / seconds,
+        'read_errors': counters['read_errors'],
+        'write_errors': counters['write_errors'],
+    }
+
+
+def main() -> None:
+    """Запуск бенчмарка для обоих профилей и вывод таблицы."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--readers', type=int, default=8, help='Количество потоков чтения')
+    parser.add_argument('--seconds', type=float, default=5.0, help='Длительность каждого прогона')
+    args = parser.parse_args()
+
+    configured = sqlite_profile(vars(Config))
+    results = [
+        run('default', DEFAULT_PROFILE, args.readers, args.seconds),
+        run('configured', configured, args.readers, args.seconds),
+    ]
+
+    print(f"Профиль из настроек: {configured}")
+    print(
+        f"{'профиль':<12}{'чтений/с':>12}{'p99 чтения, мс':>16}{'записей/с':>12}"
+        f"{'ошибок чтения':>16}{'ошибок записи':>16}"
+    )
+    for result in results:
+        print(
+            f"{result['profile']:<12}{result['reads_per_sec']:>12.0f}{result['read_p99_ms']:>16.2f}"
+            f"{result['writes_per_sec']:>12.0f}"
+            f"{result['read_errors']:>16}{result['write_errors']:>16}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,24 @@
+"""
+Скрипт переноса контента в таблицу content_values (одна строка на section, locale, key).
+Повторный запуск синхронизирует content_values с таблицей content.
+После переноса включите чтение из новой таблицы: CONTENT_STORAGE=rows.
+"""
+
+from app import create_app
+from app.database.migrations import migrate_content_to_locale_rows
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+
+def main():
+    """Перенос контента в content_values."""
+    app = create_app()
+    
+    with app.app_context():
+        count = migrate_content_to_locale_rows()
+        logger.info(f"Готово: {count} значений в content_values")
+
+
+if __name__ == '__main__':
+    main()
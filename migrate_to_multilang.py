@@ -46,21 +46,12 @@ def migrate_content_to_multilang():
             db.session.commit()
             logger.info("Столбцы добавлены")
             
-            # Обновляем каждую запись: переносим value в value_ru
-            for row in contents:
-                content_id, section, key, old_value = row
-                
-                db.session.execute(
-                    db.text("""
-                        UPDATE content 
-                        SET value_ru = :value
-                        WHERE id = :content_id
-                    """),
-                    {'value': old_value, 'content_id': content_id}
-                )
-                logger.info(f"Мигрировано: {section}.{key}")
-            
+            # Переносим value в value_ru одним UPDATE в одной транзакции.
+            # ContentRepository.bulk_set здесь не подходит: в старой таблице столбец
+            # value NOT NULL, и SQLite проверяет его раньше, чем ON CONFLICT.
+            db.session.execute(db.text("UPDATE content SET value_ru = value"))
             db.session.commit()
+            
             logger.info("Миграция успешно завершена!")
             
             # Теперь можно удалить старое поле 'value'
@@ -17,83 +17,86 @@ def seed_content():
     with app.app_context():
         logger.info("Начинаем заполнение контента на трёх языках")
         
+        # Записи собираются в список и сохраняются одной транзакцией в конце
+        rows = []
+        
         # ===== HERO СЕКЦИЯ =====
         logger.info("Заполнение Hero секции...")
         
-        ContentRepository.set(
+        rows.append(dict(
             section='hero',
             key='slogan',
             value_ru='Balance in every drop',
             value_lv='Līdzsvars katrā pilienā',
             value_en='Balance in every drop'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='hero',
             key='subtitle',
             value_ru='Персонализированные масла на основе технологий AuraCloud® 3D и ДНК-тестирования',
             value_lv='Personalizētas eļļas, pamatojoties uz AuraCloud® 3D un DNS testēšanas tehnoloģijām',
             value_en='Personalized oils based on AuraCloud® 3D and DNA testing technologies'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='hero',
             key='cta_primary',
             value_ru='Подобрать масло',
             value_lv='Izvēlēties eļļu',
             value_en='Select Oil'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='hero',
             key='cta_secondary',
             value_ru='Записаться',
             value_lv='Pierakstīties',
             value_en='Book Appointment'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='hero',
             key='scroll_text',
             value_ru='Прокрутите вниз',
             value_lv='Ritiniet uz leju',
             value_en='Scroll down'
-        )
+        ))
         
         # ===== О НАС =====
         logger.info("Заполнение О нас...")
         
-        ContentRepository.set(
+        rows.append(dict(
             section='about',
             key='title',
             value_ru='О компании OilFusion',
             value_lv='Par OilFusion uzņēmumu',
             value_en='About OilFusion'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='about',
             key='description',
             value_ru='Мы создаем персонализированные масляные композиции, учитывая уникальные особенности каждого человека',
             value_lv='Mēs izveidojam personalizētas eļļas kompozīcijas, ņemot vērā katra cilvēka unikālās īpašības',
             value_en='We create personalized oil blends tailored to each person\'s unique characteristics'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='about',
             key='philosophy',
             value_ru='Наша философия основана на научном подходе к здоровью и красоте',
             value_lv='Mūsu filozofija balstās uz zinātnisku pieeju veselībai un skaistumam',
             value_en='Our philosophy is based on a scientific approach to health and beauty'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='about',
             key='learn_more_button',
             value_ru='Узнать больше о технологиях',
             value_lv='Uzziniet vairāk par tehnoloģijām',
             value_en='Learn more about technologies'
-        )
+        ))
         
         # Features для About секции в виде JSON с мультиязычностью
         import json
@@ -118,49 +121,49 @@ def seed_content():
             }
         ]
         
-        ContentRepository.set(
+        rows.append(dict(
             section='about',
             key='features',
             value_ru=json.dumps(about_features, ensure_ascii=False),
             value_lv=json.dumps(about_features, ensure_ascii=False),
             value_en=json.dumps(about_features, ensure_ascii=False),
             data_type='json'
-        )
+        ))
         
         # ===== ПРОДУКЦИЯ =====
         logger.info("Заполнение Продукции...")
         
-        ContentRepository.set(
+        rows.append(dict(
             section='products',
             key='title',
             value_ru='Наша продукция',
             value_lv='Mūsu produkcija',
             value_en='Our Products'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='products',
             key='subtitle',
             value_ru='Персонализированные масла для вашего здоровья и гармонии',
             value_lv='Personalizētas eļļas jūsu veselībai un harmonijai',
             value_en='Personalized oils for your health and harmony'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='products',
             key='catalog_button',
             value_ru='Смотреть каталог',
             value_lv='Skatīt katalogu',
             value_en='View Catalog'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='products',
             key='details_button',
             value_ru='Подробнее',
             value_lv='Sīkāk',
             value_en='Learn More'
-        )
+        ))
         
         # Продукты в виде JSON
         import json
@@ -209,81 +212,81 @@ def seed_content():
             }
         ]
         
-        ContentRepository.set(
+        rows.append(dict(
             section='products',
             key='products',
             value_ru=json.dumps(products_list, ensure_ascii=False),
             value_lv=json.dumps(products_list, ensure_ascii=False),
             value_en=json.dumps(products_list, ensure_ascii=False),
             data_type='json'
-        )
+        ))
         
         # ===== УСЛУГИ =====
         logger.info("Заполнение Услуг...")
         
-        ContentRepository.set(
+        rows.append(dict(
             section='services',
             key='title',
             value_ru='Наши услуги',
             value_lv='Mūsu pakalpojumi',
             value_en='Our Services'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='services',
             key='subtitle',
             value_ru='Комплексный подход к вашему здоровью',
             value_lv='Visaptveroša pieeja jūsu veselībai',
             value_en='Comprehensive approach to your health'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='services',
             key='dna_testing_title',
             value_ru='ДНК-тестирование',
             value_lv='DNS testēšana',
             value_en='DNA Testing'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='services',
             key='dna_testing_desc',
             value_ru='Анализ генетических особенностей для подбора идеального состава масел',
             value_lv='Ģenētisko īpašību analīze, lai izvēlētos ideālo eļļas sastāvu',
             value_en='Genetic analysis to select the perfect oil composition'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='services',
             key='auracloud_title',
             value_ru='Сканирование AuraCloud® 3D',
             value_lv='AuraCloud® 3D skenēšana',
             value_en='AuraCloud® 3D Scanning'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='services',
             key='auracloud_desc',
             value_ru='Энергетическая диагностика состояния организма',
             value_lv='Organisma stāvokļa enerģētiskā diagnostika',
             value_en='Energy diagnostics of body condition'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='services',
             key='consultation_title',
             value_ru='Консультация специалиста',
             value_lv='Speciālista konsultācija',
             value_en='Expert Consultation'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='services',
             key='consultation_desc',
             value_ru='Индивидуальный подбор масел с учетом всех факторов',
             value_lv='Individuāla eļļu izvēle, ņemot vērā visus faktorus',
             value_en='Individual oil selection considering all factors'
-        )
+        ))
         
         # Services list в формате JSON с мультиязычностью
         services_list = [
@@ -334,570 +337,572 @@ def seed_content():
             }
         ]
         
-        ContentRepository.set(
+        rows.append(dict(
             section='services',
             key='services_list',
             value_ru=json.dumps(services_list, ensure_ascii=False),
             value_lv=json.dumps(services_list, ensure_ascii=False),
             value_en=json.dumps(services_list, ensure_ascii=False),
             data_type='json'
-        )
+        ))
         
         # ===== ПЕРСОНАЛИЗАЦИЯ =====
         logger.info("Заполнение Персонализации...")
         
-        ContentRepository.set(
+        rows.append(dict(
             section='personalization',
             key='title',
             value_ru='Персонализация',
             value_lv='Personalizācija',
             value_en='Personalization'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='personalization',
             key='subtitle',
             value_ru='Технологии для вашего здоровья',
             value_lv='Tehnoloģijas jūsu veselībai',
             value_en='Technologies for your health'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='personalization',
             key='dna_testing',
             value_ru='ДНК-тестирование позволяет определить генетические особенности и подобрать идеальный состав',
             value_lv='DNS testēšana ļauj noteikt ģenētiskās īpašības un izvēlēties ideālo sastāvu',
             value_en='DNA testing determines genetic features and selects the perfect composition'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='personalization',
             key='auracloud',
             value_ru='AuraCloud® 3D сканирование показывает текущее состояние организма',
             value_lv='AuraCloud® 3D skenēšana parāda organisma pašreizējo stāvokli',
             value_en='AuraCloud® 3D scanning shows current body condition'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='personalization',
             key='dna_testing_title',
             value_ru='ДНК-тестирование',
             value_lv='DNS testēšana',
             value_en='DNA Testing'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='personalization',
             key='auracloud_title',
             value_ru='AuraCloud® 3D',
             value_lv='AuraCloud® 3D',
             value_en='AuraCloud® 3D'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='personalization',
             key='testing_button',
             value_ru='Пройти тестирование',
             value_lv='Iziet testēšanu',
             value_en='Get Tested'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='personalization',
             key='scanning_button',
             value_ru='Пройти сканирование',
             value_lv='Iziet skenēšanu',
             value_en='Get Scanned'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='personalization',
             key='info_text',
             value_ru='Технология AuraCloud® 3D основана на Bio-Well системе',
             value_lv='AuraCloud® 3D tehnoloģija ir balstīta uz Bio-Well sistēmu',
             value_en='AuraCloud® 3D technology is based on the Bio-Well system'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='personalization',
             key='info_description',
             value_ru='Мы используем передовую технологию Bio-Well для визуализации энергетического поля человека. Эта система позволяет увидеть изменения в вашей ауре и подобрать оптимальные продукты.',
             value_lv='Mēs izmantojam progresīvo Bio-Well tehnoloģiju cilvēka enerģētiskā lauka vizualizācijai. Šī sistēma ļauj redzēt izmaiņas jūsu aurā un izvēlēties optimālos produktus.',
             value_en='We use advanced Bio-Well technology to visualize the human energy field. This system allows you to see changes in your aura and select optimal products.'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='personalization',
             key='biowell_button',
             value_ru='Узнать больше о Bio-Well',
             value_lv='Uzziniet vairāk par Bio-Well',
             value_en='Learn more about Bio-Well'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='personalization',
             key='bio_well_url',
             value_ru='https://bio-well.com',
             value_lv='https://bio-well.com',
             value_en='https://bio-well.com'
-        )
+        ))
         
         # ===== БЛОГ =====
         logger.info("Заполнение Блога...")
         
-        ContentRepository.set(
+        rows.append(dict(
             section='blog',
             key='title',
             value_ru='Блог',
             value_lv='Blogs',
             value_en='Blog'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='blog',
             key='subtitle',
             value_ru='Полезная информация о здоровье и персонализации',
             value_lv='Noderīga informācija par veselību un personalizāciju',
             value_en='Useful information about health and personalization'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='blog',
             key='read_more',
             value_ru='Читать далее',
             value_lv='Lasīt vairāk',
             value_en='Read more'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='blog',
             key='min_read',
             value_ru='мин чтения',
             value_lv='min lasīšanas',
             value_en='min read'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='blog',
             key='all_articles',
             value_ru='Читать все статьи',
             value_lv='Lasīt visus rakstus',
             value_en='Read all articles'
-        )
+        ))
         
         # Категории блога
-        ContentRepository.set(
+        rows.append(dict(
             section='blog',
             key='category_tech',
             value_ru='Технологии',
             value_lv='Tehnoloģijas',
             value_en='Technology'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='blog',
             key='category_health',
             value_ru='Здоровье',
             value_lv='Veselība',
             value_en='Health'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='blog',
             key='category_tips',
             value_ru='Советы',
             value_lv='Padomi',
             value_en='Tips'
-        )
+        ))
         
         # Статья 1 - ДНК-тестирование
-        ContentRepository.set(
+        rows.append(dict(
             section='blog',
             key='article1_title',
             value_ru='Как работает ДНК-тестирование для подбора масел',
             value_lv='Kā darbojas DNS testēšana eļļu izvēlei',
             value_en='How DNA testing works for oil selection'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='blog',
             key='article1_excerpt',
             value_ru='Узнайте о научных основах генетического тестирования и как это помогает подобрать идеальное масло именно для вас.',
             value_lv='Uzziniet par ģenētiskās testēšanas zinātniskajiem pamatiem un kā tas palīdz izvēlēties ideālo eļļu tieši jums.',
             value_en='Learn about the scientific basis of genetic testing and how it helps select the perfect oil for you.'
-        )
+        ))
         
         # Статья 2 - AuraCloud
-        ContentRepository.set(
+        rows.append(dict(
             section='blog',
             key='article2_title',
             value_ru='AuraCloud® 3D: революция в энергетической диагностике',
             value_lv='AuraCloud® 3D: revolūcija enerģētiskajā diagnostikā',
             value_en='AuraCloud® 3D: Revolution in energy diagnostics'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='blog',
             key='article2_excerpt',
             value_ru='Погрузитесь в мир передовых технологий визуализации ауры и узнайте, как это помогает улучшить ваше самочувствие.',
             value_lv='Iegremdējieties progresīvo auras vizualizācijas tehnoloģiju pasaulē un uzziniet, kā tas palīdz uzlabot jūsu pašsajūtu.',
             value_en='Dive into the world of advanced aura visualization technologies and learn how it helps improve your well-being.'
-        )
+        ))
         
         # Статья 3 - Правила использования
-        ContentRepository.set(
+        rows.append(dict(
             section='blog',
             key='article3_title',
             value_ru='10 правил использования персонализированных масел',
             value_lv='10 personalizēto eļļu lietošanas noteikumi',
             value_en='10 rules for using personalized oils'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='blog',
             key='article3_excerpt',
             value_ru='Практические рекомендации по применению наших продуктов для достижения максимального эффекта и долгосрочного результата.',
             value_lv='Praktiski ieteikumi mūsu produktu lietošanai, lai sasniegtu maksimālu efektu un ilgtermiņa rezultātu.',
             value_en='Practical recommendations for using our products to achieve maximum effect and long-term results.'
-        )
+        ))
         
         # ===== КОНТАКТЫ =====
         logger.info("Заполнение Контактов...")
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='title',
             value_ru='Контакты',
             value_lv='Kontakti',
             value_en='Contacts'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='subtitle',
             value_ru='Свяжитесь с нами',
             value_lv='Sazinieties ar mums',
             value_en='Contact Us'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='form_title',
             value_ru='Записаться на консультацию',
             value_lv='Pierakstīties konsultācijai',
             value_en='Book a Consultation'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='name_placeholder',
             value_ru='Ваше имя',
             value_lv='Jūsu vārds',
             value_en='Your Name'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='email_placeholder',
             value_ru='Email',
             value_lv='E-pasts',
             value_en='Email'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='phone_placeholder',
             value_ru='Телефон',
             value_lv='Tālrunis',
             value_en='Phone'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='message_placeholder',
             value_ru='Ваше сообщение',
             value_lv='Jūsu ziņojums',
             value_en='Your Message'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='submit_button',
             value_ru='Отправить',
             value_lv='Nosūtīt',
             value_en='Send'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='address_title',
             value_ru='Адрес',
             value_lv='Adrese',
             value_en='Address'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='phone_title',
             value_ru='Телефон',
             value_lv='Tālrunis',
             value_en='Phone'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='email_title',
             value_ru='Email',
             value_lv='E-pasts',
             value_en='Email'
-        )
+        ))
         
         # ===== AURACLOUD SLIDER =====
         logger.info("Заполнение AuraCloud слайдера...")
         
-        ContentRepository.set(
+        rows.append(dict(
             section='auracloud_slider',
             key='title',
             value_ru='Технология AuraCloud® 3D',
             value_lv='AuraCloud® 3D tehnoloģija',
             value_en='AuraCloud® 3D Technology'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='auracloud_slider',
             key='subtitle',
             value_ru='Увидьте разницу до и после',
             value_lv='Redziet atšķirību pirms un pēc',
             value_en='See the difference before and after'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='auracloud_slider',
             key='before_label',
             value_ru='До',
             value_lv='Pirms',
             value_en='Before'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='auracloud_slider',
             key='after_label',
             value_ru='После',
             value_lv='Pēc',
             value_en='After'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='auracloud_slider',
             key='description',
             value_ru='AuraCloud® 3D показывает изменения энергетического поля',
             value_lv='AuraCloud® 3D parāda enerģētiskā lauka izmaiņas',
             value_en='AuraCloud® 3D shows energy field changes'
-        )
+        ))
         
         # ===== ОТЗЫВЫ =====
         logger.info("Заполнение Отзывов...")
         
-        ContentRepository.set(
+        rows.append(dict(
             section='reviews',
             key='title',
             value_ru='Отзывы наших клиентов',
             value_lv='Mūsu klientu atsauksmes',
             value_en='Customer Reviews'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='reviews',
             key='subtitle',
             value_ru='Что говорят о нас',
             value_lv='Ko saka par mums',
             value_en='What they say about us'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='reviews',
             key='based_on',
             value_ru='На основе',
             value_lv='Pamatojoties uz',
             value_en='Based on'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='reviews',
             key='reviews_count',
             value_ru='отзывов',
             value_lv='atsauksmēm',
             value_en='reviews'
-        )
+        ))
         
         # ===== FOOTER =====
         logger.info("Заполнение Footer...")
         
-        ContentRepository.set(
+        rows.append(dict(
             section='footer',
             key='copyright',
             value_ru='© OilFusion 2024. Все права защищены.',
             value_lv='© OilFusion 2024. Visas tiesības aizsargātas.',
             value_en='© OilFusion 2024. All rights reserved.'
-        )
+        ))
         
         # ===== НАВИГАЦИЯ =====
         logger.info("Заполнение Навигации...")
         
-        ContentRepository.set(
+        rows.append(dict(
             section='nav',
             key='home',
             value_ru='Главная',
             value_lv='Sākums',
             value_en='Home'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='nav',
             key='about',
             value_ru='О нас',
             value_lv='Par mums',
             value_en='About'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='nav',
             key='products',
             value_ru='Продукция',
             value_lv='Produkti',
             value_en='Products'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='nav',
             key='services',
             value_ru='Услуги',
             value_lv='Pakalpojumi',
             value_en='Services'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='nav',
             key='personalization',
             value_ru='Персонализация',
             value_lv='Personalizācija',
             value_en='Personalization'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='nav',
             key='reviews',
             value_ru='Отзывы',
             value_lv='Atsauksmes',
             value_en='Reviews'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='nav',
             key='blog',
             value_ru='Блог',
             value_lv='Blogs',
             value_en='Blog'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='nav',
             key='contacts',
             value_ru='Контакты',
             value_lv='Kontakti',
             value_en='Contacts'
-        )
+        ))
         
         # ===== КОНТАКТЫ (дополнительные переводы) =====
         logger.info("Дополнение переводов контактов...")
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='address_label',
             value_ru='Адрес',
             value_lv='Adrese',
             value_en='Address'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='phone_label',
             value_ru='Телефон',
             value_lv='Tālrunis',
             value_en='Phone'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='email_label',
             value_ru='Email',
             value_lv='E-pasts',
             value_en='Email'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='hours_label',
             value_ru='Режим работы',
             value_lv='Darba laiks',
             value_en='Working hours'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='hours_weekdays',
             value_ru='Пн-Пт: 10:00 - 20:00',
             value_lv='Pr-Pk: 10:00 - 20:00',
             value_en='Mon-Fri: 10:00 AM - 8:00 PM'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='hours_weekend',
             value_ru='Сб-Вс: 11:00 - 18:00',
             value_lv='Se-Sv: 11:00 - 18:00',
             value_en='Sat-Sun: 11:00 AM - 6:00 PM'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='form_name_placeholder',
             value_ru='Ваше имя',
             value_lv='Jūsu vārds',
             value_en='Your name'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='form_phone_placeholder',
             value_ru='Телефон',
             value_lv='Tālrunis',
             value_en='Phone'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='form_email_placeholder',
             value_ru='Email',
             value_lv='E-pasts',
             value_en='Email'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='form_message_placeholder',
             value_ru='Комментарий',
             value_lv='Komentārs',
             value_en='Message'
-        )
+        ))
         
-        ContentRepository.set(
+        rows.append(dict(
             section='contacts',
             key='form_submit',
             value_ru='Отправить',
             value_lv='Nosūtīt',
             value_en='Submit'
-        )
+        ))
+        
+        ContentRepository.bulk_set(rows)
         
         logger.info("✅ Контент успешно заполнен для всех секций на трёх языках!")
         logger.info("Теперь можно переключать языки на сайте и редактировать в админке")
@@ -0,0 +1,103 @@
+"""
+Общие фикстуры тестов.
+
+Приложение создаётся на копии JSON-файлов из data во временной папке:
+тесты пишут контент, счётчики версий и кеш изображений только туда.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from app import create_app
+from app.config.settings import TestingConfig
+from app.database.cache import image_cache, json_value_cache, section_cache, settings_cache
+from app.utils.fragment_cache import fragment_cache
+from app.utils.page_cache import page_cache
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+# Код, который выполняется в отдельном процессе на той же папке data
+_WORKER_SCRIPT = '''
+import sys
+from pathlib import Path
+
+from app import create_app
+from app.config.settings import TestingConfig
+from app.database import ContentRepository, SettingRepository
+
+
+class Config(TestingConfig):
+    BASE_DIR = Path(sys.argv[1])
+
+
+worker = create_app(Config)
+with worker.app_context():
+{code}
+'''
+
+
+@pytest.fixture(scope='session')
+def app(tmp_path_factory):
+    """Приложение с БД, data и static во временной папке."""
+    base_dir = tmp_path_factory.mktemp('site')
+    (base_dir / 'data').mkdir()
+    for path in (REPO_DIR / 'data').glob('*.json'):
+        shutil.copy(path, base_dir / 'data' / path.name)
+    shutil.copytree(REPO_DIR / 'app' / 'static', base_dir / 'static')
+
+    class Config(TestingConfig):
+        BASE_DIR = base_dir
+        # Версию контента сверяем на каждом запросе, а не раз в 500 мс
+        CONTENT_VERSION_CHECK_MS = 0
+        SITE_URL = 'https://oilfusion.test'
+
+    # Модели фонов и видимости секций читают data/*.json относительно рабочей папки
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(base_dir)
+        application = create_app(Config)
+        application.static_folder = str(base_dir / 'static')
+        yield application
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """Каждый тест начинает с пустых кешей процесса."""
+    for cache in (section_cache, json_value_cache, settings_cache, image_cache, page_cache, fragment_cache):
+        cache.clear()
+    yield
+
+
+@pytest.fixture
+def other_worker(app):
+    """
+    Выполнить код в другом процессе (как в другом воркере gunicorn)
+    с той же БД и тем же файлом data/content.version.
+    """
+    def run(code: str) -> None:
+        script = _WORKER_SCRIPT.format(code=textwrap.indent(textwrap.dedent(code), '    '))
+        subprocess.run(
+            [sys.executable, '-c', script, str(app.config['BASE_DIR'])],
+            cwd=app.config['BASE_DIR'],
+            env={**os.environ, 'PYTHONPATH': str(REPO_DIR)},
+            check=True,
+            capture_output=True,
+        )
+
+    return run
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def app_context(app):
+    with app.app_context():
+        yield
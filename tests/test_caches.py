@@ -0,0 +1,99 @@
+"""
+Кеши контента, настроек и изображений: запись видна на следующем чтении,
+в том числе после записи в другом воркере (через data/content.version).
+"""
+
+from app.database import ContentRepository, ImageRepository, SettingRepository
+from app.database.cache import section_cache, settings_cache
+from app.database.version_stamp import content_version_stamp
+
+
+def test_section_write_visible_on_next_read(app_context):
+    ContentRepository.set('cache_test', 'title', value_ru='Первый')
+    assert ContentRepository.get_section('cache_test', 'ru')['title'] == 'Первый'
+    assert ContentRepository.get_section('cache_test', 'ru')['title'] == 'Первый'
+
+    ContentRepository.set('cache_test', 'title', value_ru='Второй')
+    assert ContentRepository.get_section('cache_test', 'ru')['title'] == 'Второй'
+
+
+def test_section_write_invalidates_only_its_section(app_context):
+    ContentRepository.set('cache_a', 'title', value_ru='A')
+    ContentRepository.set('cache_b', 'title', value_ru='B')
+    ContentRepository.get_sections(['cache_a', 'cache_b'], 'ru')
+
+    ContentRepository.set('cache_a', 'title', value_ru='A2')
+    hits = section_cache.hits
+    sections = ContentRepository.get_sections(['cache_a', 'cache_b'], 'ru')
+    assert sections['cache_a']['title'] == 'A2'
+    assert sections['cache_b']['title'] == 'B'
+    assert section_cache.hits == hits + 1
+
+
+def test_cached_section_is_copied(app_context):
+    ContentRepository.set('cache_copy', 'items', value_ru='[{"name": "a"}]', data_type='json')
+    first = ContentRepository.get_section('cache_copy', 'ru')
+    first['items'][0]['name'] = 'изменено'
+    first['extra'] = True
+
+    second = ContentRepository.get_section('cache_copy', 'ru')
+    assert second == {'items': [{'name': 'a'}]}
+
+
+def test_invalid_json_falls_back_to_empty_list(app_context):
+    ContentRepository.set('cache_json', 'items', value_ru='{не json', data_type='json')
+    assert ContentRepository.get_section('cache_json', 'ru')['items'] == []
+
+
+def test_content_written_by_other_worker_visible_after_check(app_context, other_worker):
+    ContentRepository.set('cache_worker', 'title', value_ru='До')
+    assert ContentRepository.get_section('cache_worker', 'ru')['title'] == 'До'
+
+    other_worker("ContentRepository.set('cache_worker', 'title', value_ru='После')")
+
+    assert ContentRepository.get_section('cache_worker', 'ru')['title'] == 'До'
+    assert content_version_stamp.check()
+    assert ContentRepository.get_section('cache_worker', 'ru')['title'] == 'После'
+
+
+def test_setting_write_visible_on_next_read(app_context):
+    SettingRepository.set('cache_setting', 'one')
+    assert SettingRepository.get('cache_setting') == 'one'
+
+    SettingRepository.set('cache_setting', 'two')
+    assert SettingRepository.get('cache_setting') == 'two'
+
+
+def test_settings_from_other_worker_clear_only_settings(app_context, other_worker):
+    SettingRepository.set('cache_worker_setting', 'old')
+    ContentRepository.set('cache_kept', 'title', value_ru='Контент')
+    assert SettingRepository.get('cache_worker_setting') == 'old'
+    ContentRepository.get_section('cache_kept', 'ru')
+
+    other_worker("SettingRepository.set('cache_worker_setting', 'new')")
+
+    section_version = section_cache.version
+    assert content_version_stamp.check()
+    assert settings_cache.get() is None
+    assert SettingRepository.get('cache_worker_setting') == 'new'
+    # Кеш контента (и страниц) после записи настроек не сбрасывается
+    assert section_cache.version == section_version
+    assert section_cache.get('cache_kept', 'ru') is not None
+
+
+def test_image_record_visible_on_next_read(app_context):
+    url = '/static/img/cache-test.png'
+    assert ImageRepository.get_image_set(url) is None
+
+    ImageRepository.create(
+        filename='cache-test.png',
+        original_filename='cache-test.png',
+        url=url,
+        section='hero',
+        field='background',
+        width=1200,
+        height=800,
+    )
+    image_set = ImageRepository.get_image_set(url)
+    assert image_set is not None
+    assert image_set.candidates == ((url, 1200),)
@@ -0,0 +1,112 @@
+"""
+Уменьшенные копии /img/<ширина>/ и загрузки под хешем содержимого.
+"""
+
+import io
+from pathlib import Path
+
+import pytest
+from PIL import Image
+from werkzeug.datastructures import FileStorage
+
+from app.database import ImageRepository
+from app.utils.image_pipeline import is_content_addressed, store_uploaded_image
+from app.utils.image_resize import resized_images
+
+
+def _png(width: int = 1200, height: int = 600, color: str = 'teal') -> bytes:
+    buffer = io.BytesIO()
+    Image.new('RGB', (width, height), color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def source(app, request):
+    """Картинка в static/img, своя для каждого теста."""
+    path = Path(app.static_folder) / 'img' / f'{request.node.name}.png'
+    path.write_bytes(_png())
+    yield f'img/{path.name}'
+    path.unlink()
+
+
+def test_resized_image_is_webp(client, source):
+    response = client.get(f'/img/480/{source}')
+    assert response.status_code == 200
+    assert response.mimetype == 'image/webp'
+    assert Image.open(io.BytesIO(response.data)).size == (480, 240)
+    assert 'public' in response.headers['Cache-Control']
+    assert 'Set-Cookie' not in response.headers
+
+    cached = client.get(f'/img/480/{source}', headers={'If-None-Match': response.headers['ETag']})
+    assert cached.status_code == 304
+
+
+def test_resized_width_allow_list(app, client, source):
+    assert 123 not in app.config['IMAGE_VARIANT_WIDTHS']
+    assert client.get(f'/img/123/{source}').status_code == 404
+
+
+@pytest.mark.parametrize('filename', [
+    'img/missing.png',
+    '../app/__init__.py',
+    '../../data/oilfusion.db',
+    'css/style.css',
+])
+def test_resized_rejects_paths_outside_images(client, filename):
+    assert client.get(f'/img/480/{filename}').status_code == 404
+
+
+def test_resized_cache_hit_and_throttled_sweep(client, source, monkeypatch):
+    monkeypatch.setattr(resized_images, '_max_bytes', 1024 * 1024 * 1024)
+    client.get(f'/img/480/{source}')
+    misses, hits, sweeps = resized_images.misses, resized_images.hits, resized_images.sweeps
+
+    client.get(f'/img/480/{source}')
+    assert (resized_images.misses, resized_images.hits) == (misses, hits + 1)
+
+    # Новая копия в пределах интервала и лимита не обходит папку кеша
+    client.get(f'/img/960/{source}')
+    assert resized_images.misses == misses + 1
+    assert resized_images.sweeps == sweeps
+
+
+def test_resized_eviction_keeps_served_file(client, source, monkeypatch):
+    client.get(f'/img/480/{source}')
+    monkeypatch.setattr(resized_images, '_max_bytes', 1)
+    evictions = resized_images.evictions
+
+    response = client.get(f'/img/960/{source}')
+    assert response.status_code == 200
+    assert Image.open(io.BytesIO(response.data)).size == (960, 480)
+    assert resized_images.evictions > evictions
+
+
+def test_upload_is_content_addressed_and_deduplicated(app):
+    data = _png(color='orange')
+    with app.test_request_context():
+        url = store_uploaded_image(FileStorage(io.BytesIO(data), 'фото.png'), 'hero', 'background')
+        again = store_uploaded_image(FileStorage(io.BytesIO(data), 'copy.png'), 'about', 'image')
+        other = store_uploaded_image(FileStorage(io.BytesIO(_png(color='navy')), 'фото.png'), 'hero', 'background')
+
+        filename = url.rsplit('/', 1)[1]
+        assert is_content_addressed(filename)
+        assert again == url
+        assert other != url
+        assert ImageRepository.get_by_filename(filename) is not None
+        assert ImageRepository.get_image_set(url).candidates[0][1] == 480
+
+    folder = Path(app.static_folder) / 'img'
+    assert (folder / filename).read_bytes() == data
+    assert not list(folder.glob('.*'))
+
+
+def test_content_addressed_upload_is_immutable(app, client):
+    with app.test_request_context():
+        url = store_uploaded_image(FileStorage(io.BytesIO(_png(color='olive')), 'a.png'), 'hero', 'background')
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert 'immutable' in response.headers['Cache-Control']
+
+    plain = client.get('/static/img/hero.png')
+    assert 'immutable' not in plain.headers.get('Cache-Control', '')
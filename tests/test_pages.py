@@ -0,0 +1,101 @@
+"""
+Кеш публичных страниц: ETag и 304, обновление после записи,
+страницы с префиксом языка и hreflang.
+"""
+
+import pytest
+
+from app.database import ContentRepository
+
+
+@pytest.fixture
+def locale_prefix(app, monkeypatch):
+    """Режим LOCALE_URL_PREFIX на время теста."""
+    monkeypatch.setitem(app.config, 'LOCALE_URL_PREFIX', True)
+
+
+def _set_subtitle(app, value: str) -> None:
+    with app.app_context():
+        ContentRepository.set('hero', 'subtitle', value_ru=value)
+
+
+def test_etag_and_not_modified(client):
+    response = client.get('/')
+    assert response.status_code == 200
+    assert response.headers['ETag']
+    assert 'no-cache' in response.headers['Cache-Control']
+
+    cached = client.get('/', headers={'If-None-Match': response.headers['ETag']})
+    assert cached.status_code == 304
+    assert cached.data == b''
+
+
+def test_write_refreshes_cached_page(app, client):
+    _set_subtitle(app, 'Подзаголовок один')
+    first = client.get('/')
+    assert 'Подзаголовок один' in first.get_data(as_text=True)
+
+    _set_subtitle(app, 'Подзаголовок два')
+    second = client.get('/', headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    assert second.headers['ETag'] != first.headers['ETag']
+    assert 'Подзаголовок два' in second.get_data(as_text=True)
+
+
+def test_write_in_other_worker_refreshes_cached_page(app, client, other_worker):
+    _set_subtitle(app, 'Подзаголовок воркера')
+    first = client.get('/')
+    assert client.get('/', headers={'If-None-Match': first.headers['ETag']}).status_code == 304
+
+    # Об изменении этому процессу сообщает только общий файл data/content.version
+    other_worker("ContentRepository.set('hero', 'subtitle', value_ru='Из другого воркера')")
+
+    second = client.get('/', headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    assert 'Из другого воркера' in second.get_data(as_text=True)
+
+
+def test_locale_prefixed_pages(client):
+    for lang in ('ru', 'lv', 'en'):
+        response = client.get(f'/{lang}/')
+        assert response.status_code == 200
+        assert f'lang="{lang}"' in response.get_data(as_text=True)
+        assert 'public' in response.headers['Cache-Control']
+        assert 'Set-Cookie' not in response.headers
+
+    assert client.get('/en/catalog').status_code == 200
+    assert client.get('/de/').status_code == 404
+
+
+def test_prefixed_pages_cached_per_language(client):
+    ru = client.get('/ru/')
+    en = client.get('/en/')
+    assert ru.headers['ETag'] != en.headers['ETag']
+    assert client.get('/en/', headers={'If-None-Match': en.headers['ETag']}).status_code == 304
+
+
+def test_redirect_to_locale_prefix(client, locale_prefix):
+    response = client.get('/catalog?lang=en')
+    assert response.status_code == 302
+    assert response.headers['Location'].endswith('/en/catalog')
+
+    assert client.get('/').headers['Location'].endswith('/ru/')
+    assert client.get('/lv/').status_code == 200
+
+
+def test_links_keep_locale_prefix(client):
+    html = client.get('/lv/').get_data(as_text=True)
+    assert 'href="/lv/catalog"' in html
+
+
+def test_set_language_switches_prefix(client):
+    response = client.get('/set_language/en?next=/ru/catalog')
+    assert response.status_code == 302
+    assert response.headers['Location'].endswith('/en/catalog')
+
+
+def test_hreflang_uses_site_url_not_host(client):
+    html = client.get('/en/', headers={'Host': 'evil.example'}).get_data(as_text=True)
+    assert 'evil.example' not in html
+    assert 'hreflang="lv" href="https://oilfusion.test/lv/"' in html
+    assert 'hreflang="x-default" href="https://oilfusion.test/"' in html
@@ -0,0 +1,70 @@
+"""
+Запись контента: bulk_set и документы страниц (page_documents).
+"""
+
+import json
+
+from sqlalchemy import select
+
+from app.database import ContentRepository, db
+from app.database.models import PageDocument
+
+
+def _page_section(section: str, locale: str = 'ru') -> dict:
+    table = PageDocument.__table__
+    payload = db.session.execute(
+        select(table.c.payload).where(table.c.page == 'index', table.c.locale == locale)
+    ).scalar_one()
+    return json.loads(payload)[section]
+
+
+def test_bulk_set_writes_rows_in_one_call(app_context):
+    count = ContentRepository.bulk_set([
+        {'section': 'bulk_test', 'key': 'title', 'value_ru': 'Заголовок', 'value_en': 'Title'},
+        {'section': 'bulk_test', 'key': 'items', 'value_ru': '[1, 2]', 'data_type': 'json'},
+    ])
+    assert count == 2
+
+    assert ContentRepository.get_section('bulk_test', 'ru') == {'title': 'Заголовок', 'items': [1, 2]}
+    assert ContentRepository.get_section('bulk_test', 'en')['title'] == 'Title'
+    # Нет перевода - русский текст
+    assert ContentRepository.get_section('bulk_test', 'lv')['title'] == 'Заголовок'
+
+
+def test_bulk_set_keeps_values_passed_as_none(app_context):
+    ContentRepository.bulk_set([{'section': 'bulk_keep', 'key': 'title', 'value_ru': 'Ру', 'value_en': 'En'}])
+    ContentRepository.bulk_set([{'section': 'bulk_keep', 'key': 'title', 'value_ru': 'Ру 2'}])
+
+    assert ContentRepository.get_section('bulk_keep', 'ru')['title'] == 'Ру 2'
+    assert ContentRepository.get_section('bulk_keep', 'en')['title'] == 'En'
+
+
+def test_bulk_set_empty(app_context):
+    assert ContentRepository.bulk_set([]) == 0
+
+
+def test_page_documents_follow_set_and_delete(app_context):
+    ContentRepository.set('hero', 'doc_test', value_ru='В документе', value_en='In document')
+    assert _page_section('hero')['doc_test'] == 'В документе'
+    assert _page_section('hero', 'en')['doc_test'] == 'In document'
+    assert ContentRepository.get_page('index', 'en', ['hero'])['hero']['doc_test'] == 'In document'
+
+    assert ContentRepository.delete('hero', 'doc_test')
+    assert 'doc_test' not in _page_section('hero')
+    assert 'doc_test' not in ContentRepository.get_page('index', 'ru', ['hero'])['hero']
+    assert not ContentRepository.delete('hero', 'doc_test')
+
+
+def test_page_documents_follow_bulk_set(app_context):
+    ContentRepository.bulk_set([{'section': 'about', 'key': 'doc_bulk', 'value_ru': 'Пакет'}])
+    assert _page_section('about')['doc_bulk'] == 'Пакет'
+    assert ContentRepository.get_page('index', 'ru', ['about'])['about']['doc_bulk'] == 'Пакет'
+
+
+def test_rebuild_page_documents(app_context):
+    ContentRepository.set('hero', 'doc_rebuild', value_ru='Снова')
+    db.session.execute(PageDocument.__table__.delete())
+    db.session.commit()
+
+    assert ContentRepository.rebuild_page_documents() == 3
+    assert _page_section('hero')['doc_rebuild'] == 'Снова'
@@ -0,0 +1,89 @@
+"""
+Очередь записи: пакет в одной транзакции, изоляция ошибок операций,
+обработчики после фиксации.
+"""
+
+import threading
+
+import pytest
+
+from app.database import ContentRepository, db
+from app.database.models import Setting
+from app.database.writer import after_commit, commit, in_write_batch, write_queue
+
+
+def _add_setting(key: str) -> str:
+    db.session.add(Setting(key=key, value='1'))
+    commit()
+    return key
+
+
+def _fail(message: str) -> None:
+    db.session.add(Setting(key=f'writer_failed_{message}', value='1'))
+    db.session.flush()
+    raise ValueError(message)
+
+
+def _setting_exists(key: str) -> bool:
+    return db.session.query(Setting).filter_by(key=key).first() is not None
+
+
+def test_failed_operation_does_not_roll_back_batch(app_context):
+    # Пока поток-писатель занят, операции копятся и выполняются одним пакетом
+    release = threading.Event()
+    blocker = write_queue.submit(release.wait, 5)
+    futures = [
+        write_queue.submit(_add_setting, 'writer_ok_1'),
+        write_queue.submit(_fail, 'boom'),
+        write_queue.submit(_add_setting, 'writer_ok_2'),
+    ]
+    batches = write_queue.batches
+    release.set()
+    blocker.result(timeout=5)
+
+    assert futures[0].result(timeout=5) == 'writer_ok_1'
+    with pytest.raises(ValueError, match='boom'):
+        futures[1].result(timeout=5)
+    assert futures[2].result(timeout=5) == 'writer_ok_2'
+    assert write_queue.batches == batches + 1
+
+    assert _setting_exists('writer_ok_1')
+    assert _setting_exists('writer_ok_2')
+    assert not _setting_exists('writer_failed_boom')
+
+
+def test_repository_mutation_goes_through_queue(app_context):
+    operations = write_queue.operations
+    ContentRepository.set('writer_test', 'title', value_ru='Через очередь')
+    assert write_queue.operations == operations + 1
+
+
+def test_repository_error_reaches_caller(app_context):
+    with pytest.raises(KeyError):
+        ContentRepository.bulk_set([{'section': 'writer_test'}])
+    # Очередь продолжает работать после ошибки операции
+    ContentRepository.set('writer_test', 'after_error', value_ru='ok')
+    assert ContentRepository.get_section('writer_test', 'ru')['after_error'] == 'ok'
+
+
+def test_after_commit_runs_once_per_key(app_context):
+    calls = []
+
+    def operation(name: str) -> bool:
+        after_commit(lambda: calls.append(name), key='writer_hook')
+        return in_write_batch()
+
+    release = threading.Event()
+    blocker = write_queue.submit(release.wait, 5)
+    futures = [write_queue.submit(operation, name) for name in ('first', 'second')]
+    release.set()
+    blocker.result(timeout=5)
+
+    assert all(future.result(timeout=5) for future in futures)
+    assert calls == ['first']
+
+
+def test_after_commit_outside_batch_runs_immediately():
+    calls = []
+    after_commit(lambda: calls.append(True))
+    assert calls == [True]